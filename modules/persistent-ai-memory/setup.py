@@ -41,6 +41,12 @@ setup(
             "black>=23.0.0",
             "flake8>=6.0.0",
         ],
+        "onnx": [
+            "optimum[onnxruntime]>=1.16.0",
+        ],
+        "hnswlib": [
+            "hnswlib>=0.8.0",
+        ],
     },
     entry_points={
         "console_scripts": [
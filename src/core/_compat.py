@@ -0,0 +1,50 @@
+"""
+Optional accelerators and version shims shared by the core modules.
+
+Each optional dependency has a pure-stdlib fallback that gives the same
+results, so callers never need to check what is installed.
+"""
+
+import hashlib
+import json
+import sys
+from typing import Any
+
+# Prefer orjson for hot JSON paths, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# xxhash is optional, hashlib's blake2b is the fallback for short IDs
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Slotted dataclasses need Python 3.10+; older interpreters get regular ones
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON from bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def short_id(text: str, length: int = 16) -> str:
+    """Identifier of length hex characters (even, at most 16) derived from text"""
+    data = text.encode()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(data)[:length]
+    return hashlib.blake2b(data, digest_size=length // 2).hexdigest()
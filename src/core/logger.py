@@ -7,8 +7,12 @@ for the web monitoring interface.
 """
 
 import asyncio
+import atexit
 import json
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
     """
@@ -49,7 +53,7 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 import threading
 from collections import deque
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 
 
@@ -74,10 +78,20 @@ class LogEntry:
     message: str
     timestamp: datetime
     metadata: Dict[str, Any] = None
+    type_str: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # Accept either the enum or its string value; keep the string on the
+        # entry so broadcasts don't dereference the enum for every client
+        if isinstance(self.type, LogType):
+            self.type_str = self.type.value
+        else:
+            self.type_str = self.type
+            self.type = LogType(self.type)
     
     def to_dict(self):
         return {
-            'type': self.type.value,
+            'type': self.type_str,
             'message': self.message,
             'timestamp': self.timestamp.isoformat(),
             'metadata': self.metadata or {}
@@ -108,12 +122,19 @@ class OSALogger:
         # Setup file logging
         self.setup_file_logging()
         
-        # Start WebSocket server in background
+        # WebSocket server runs in a background thread, started on first log
+        self.loop = asyncio.new_event_loop()
         self.server_thread = threading.Thread(target=self.run_server, daemon=True)
-        self.server_thread.start()
+        self._server_lock = threading.Lock()
+        self._server_started = False
         
-        # Log startup
-        self.log(LogType.SYSTEM, "OSA Logger initialized")
+        # Log startup (file and history only, doesn't start the server)
+        self.logs.append(LogEntry(
+            type=LogType.SYSTEM,
+            message="OSA Logger initialized",
+            timestamp=datetime.now()
+        ))
+        self.logger.info(f"[{LogType.SYSTEM.value}] OSA Logger initialized")
     
     def setup_file_logging(self):
         """Setup file-based logging"""
@@ -125,18 +146,50 @@ class OSALogger:
         session_dir = log_dir / self.current_session_id
         session_dir.mkdir(exist_ok=True)
         
-        # Setup Python logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(session_dir / "osa.log"),
-                logging.StreamHandler()
-            ]
+        # Setup Python logging on a dedicated 'OSA' logger instead of the
+        # root logger; records are written to disk by a queue listener thread
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
+        file_handler = logging.FileHandler(session_dir / "osa.log")
+        file_handler.setFormatter(formatter)
+        handlers = [file_handler]
+        
+        # Console output only when explicitly debugging
+        if os.environ.get('OSA_DEBUG') == '1':
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+            handlers.append(stream_handler)
+        
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers)
+        listener.start()
         
         self.session_dir = session_dir
         self.logger = logging.getLogger('OSA')
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, QueueHandler):
+                self.logger.removeHandler(handler)
+        self.logger.addHandler(QueueHandler(log_queue))
+        
+        # The old listener is stopped only after its queue is swapped out,
+        # so it drains every record it was given; the daemon thread would
+        # otherwise drop whatever is still queued at exit
+        if getattr(self, 'log_listener', None) is not None:
+            self.close()
+        else:
+            atexit.register(self.close)
+        self.log_listener = listener
+    
+    def close(self):
+        """Write out queued log records and stop the listener thread"""
+        listener, self.log_listener = self.log_listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
     
     def log(self, log_type: LogType, message: str, metadata: Dict[str, Any] = None):
         """Log an event"""
@@ -151,16 +204,17 @@ class OSALogger:
         self.logs.append(entry)
         
         # Log to file
-        self.logger.info(f"[{log_type.value}] {message}")
+        self.logger.info(f"[{entry.type_str}] {message}")
         
         # Send to WebSocket clients
+        self.ensure_server_started()
         asyncio.run_coroutine_threadsafe(
             self.broadcast(entry),
             self.loop
         )
         
         # Update metrics based on log type
-        self.update_metrics(log_type, metadata)
+        self.update_metrics(entry.type, metadata)
     
     def update_metrics(self, log_type: LogType, metadata: Optional[Dict]):
         """Update metrics based on log entry"""
@@ -188,7 +242,7 @@ class OSALogger:
         if self.clients:
             message = json.dumps({
                 'type': 'log',
-                'category': entry.type.value,
+                'category': entry.type_str,
                 'message': entry.message,
                 'timestamp': entry.timestamp.isoformat(),
                 'metadata': entry.metadata or {}
@@ -248,7 +302,7 @@ class OSALogger:
             for log in list(self.logs)[-50:]:  # Last 50 logs
                 await websocket.send(json.dumps({
                     'type': 'log',
-                    'category': log.type.value,
+                    'category': log.type_str,
                     'message': log.message,
                     'timestamp': log.timestamp.isoformat(),
                     'metadata': log.metadata or {}
@@ -278,9 +332,17 @@ class OSALogger:
         # Keep server running
         await asyncio.Future()
     
+    def ensure_server_started(self):
+        """Start the WebSocket server thread if it isn't running yet"""
+        if self._server_started:
+            return
+        with self._server_lock:
+            if not self._server_started:
+                self.server_thread.start()
+                self._server_started = True
+    
     def run_server(self):
         """Run the WebSocket server in a thread"""
-        self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
         self.loop.run_until_complete(self.start_server())
     
@@ -353,12 +415,15 @@ class OSALogger:
 
 # Global logger instance
 _logger_instance = None
+_logger_lock = threading.Lock()
 
 def get_osa_logger() -> OSALogger:
     """Get or create the global OSA logger"""
     global _logger_instance
     if _logger_instance is None:
-        _logger_instance = OSALogger()
+        with _logger_lock:
+            if _logger_instance is None:
+                _logger_instance = OSALogger()
     return _logger_instance
 
 
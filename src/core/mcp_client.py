@@ -5,15 +5,23 @@ Connects to Model Context Protocol servers for enhanced capabilities
 """
 
 import os
-import json
+import re
 import asyncio
+import functools
+import itertools
 import subprocess
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
+# json_dumps/json_loads use orjson on the JSON-RPC hot path when installed
+from ._compat import DATACLASS_SLOTS, json_dumps, json_loads
+
 # Try importing MCP SDK if available
 try:
     import mcp
@@ -22,6 +30,50 @@ except ImportError:
     MCP_AVAILABLE = False
     print("MCP SDK not available. Install with: pip install mcp")
 
+MCP_PROTOCOL_VERSION = "2024-11-05"
+
+# Upper bound on queued bytes coalesced into one stdin write
+WRITE_BATCH_BYTES = 64 * 1024
+
+# Maximum number of servers stop_all_servers shuts down at the same time
+MAX_CONCURRENT_STOPS = 8
+
+# Seconds get_all_server_status may serve a cached snapshot
+STATUS_CACHE_TTL = 0.2
+
+# Stream buffer limit for server output; a single message (e.g. a full
+# read_file result) must fit, the asyncio default of 64 KiB is too small
+MAX_MESSAGE_BYTES = 32 * 1024 * 1024
+
+# Idempotent tools whose results call_tool may reuse within the cache TTL
+CACHEABLE_TOOLS = frozenset({"read_file", "status", "list_directory", "query"})
+
+# Most tool results kept per client, least recently used are dropped first
+TOOL_CACHE_SIZE = 256
+
+_CONTENT_LENGTH_RE = re.compile(rb"Content-Length:\s*(\d+)", re.IGNORECASE)
+
+
+async def _read_message(reader: asyncio.StreamReader) -> bytes:
+    """
+    Read one message body from a server's stdout.
+    
+    MCP stdio servers send newline-delimited JSON; servers that frame
+    messages LSP-style with a Content-Length header are read with a
+    single readexactly() of the announced size. Returns b"" on EOF.
+    """
+    line = await reader.readline()
+    match = _CONTENT_LENGTH_RE.match(line)
+    if match is None:
+        return line
+    
+    # Skip any remaining headers up to the blank separator line
+    while line.strip():
+        line = await reader.readline()
+        if not line:
+            return b""
+    return await reader.readexactly(int(match.group(1)))
+
 
 class MCPServerType(Enum):
     """Types of MCP servers"""
@@ -39,28 +91,249 @@ class MCPServerType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MCPServerConfig:
     """Configuration for an MCP server"""
     name: str
     server_type: MCPServerType
     command: str
     args: List[str]
-    env: Dict[str, str] = None
-    config: Dict[str, Any] = None
+    env: Dict[str, str] = field(default_factory=dict)
+    config: Dict[str, Any] = field(default_factory=dict)
     enabled: bool = True
     auto_start: bool = True
     
 
+@dataclass(**DATACLASS_SLOTS)
+class ServerRuntime:
+    """Runtime state of a started MCP server"""
+    config: MCPServerConfig
+    process: Optional["MCPServerProcess"] = None
+    connected: bool = False
+    reader_task: Optional[asyncio.Task] = None
+    writer_task: Optional[asyncio.Task] = None
+    write_queue: Optional[asyncio.Queue] = None
+    pending: Dict[int, asyncio.Future] = field(default_factory=dict)
+
+
+class MCPServerProcess:
+    """
+    Async view of an MCP server subprocess.
+    
+    The fork/exec runs in a worker thread so starting several servers
+    doesn't stall the event loop; stdio pipes are then attached to the
+    loop as regular asyncio streams. Exit status is reaped by a daemon
+    thread per process (the ThreadedChildWatcher model), so no asyncio
+    child watcher or SIGCHLD handler on the main loop is involved.
+    """
+    
+    def __init__(self, popen: subprocess.Popen, stdin: asyncio.StreamWriter,
+                 stdout: asyncio.StreamReader, stderr: asyncio.StreamReader,
+                 exited: asyncio.Future):
+        self._popen = popen
+        self.stdin = stdin
+        self.stdout = stdout
+        self.stderr = stderr
+        self._exited = exited
+    
+    @classmethod
+    async def spawn(cls, args: List[str], env: Dict[str, str]) -> "MCPServerProcess":
+        """Start a process off the event loop and wire its pipes to it"""
+        loop = asyncio.get_running_loop()
+        popen = await loop.run_in_executor(None, functools.partial(
+            subprocess.Popen,
+            args,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=True
+        ))
+        
+        stdout = asyncio.StreamReader(limit=MAX_MESSAGE_BYTES, loop=loop)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(stdout, loop=loop), popen.stdout)
+        stderr = asyncio.StreamReader(loop=loop)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(stderr, loop=loop), popen.stderr)
+        transport, protocol = await loop.connect_write_pipe(
+            lambda: asyncio.streams.FlowControlMixin(loop=loop), popen.stdin
+        )
+        stdin = asyncio.StreamWriter(transport, protocol, None, loop)
+        
+        # Reap the child from a waiter thread and publish its exit on the loop
+        exited = loop.create_future()
+        
+        def _wait_for_exit():
+            returncode = popen.wait()
+            loop.call_soon_threadsafe(
+                lambda: exited.done() or exited.set_result(returncode)
+            )
+        
+        threading.Thread(
+            target=_wait_for_exit,
+            name=f"mcp-server-waiter-{popen.pid}",
+            daemon=True
+        ).start()
+        return cls(popen, stdin, stdout, stderr, exited)
+    
+    @property
+    def pid(self) -> int:
+        return self._popen.pid
+    
+    @property
+    def returncode(self) -> Optional[int]:
+        return self._exited.result() if self._exited.done() else None
+    
+    async def wait(self) -> int:
+        """Wait for the process to exit and return its exit code"""
+        return await asyncio.shield(self._exited)
+    
+    def terminate(self):
+        if not self._exited.done():
+            self._popen.terminate()
+    
+    def kill(self):
+        if not self._exited.done():
+            self._popen.kill()
+    
+    def close(self):
+        """Close the stdin pipe"""
+        self.stdin.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config_inputs() -> Tuple[str, str, str, str]:
+    """Documents dir, cwd, OSA database path and GitHub token the default
+    configurations are built from (looked up once per process)"""
+    home = Path.home()
+    return (
+        str(home / "Documents"),
+        str(Path.cwd()),
+        str(home / ".osa" / "osa.db"),
+        os.getenv("GITHUB_TOKEN", "")
+    )
+
+
+def _build_default_configs() -> Dict[str, MCPServerConfig]:
+    """Build fresh default MCP server configurations"""
+    documents_dir, cwd, osa_db, github_token = _default_config_inputs()
+    
+    configs = {}
+    
+    # Filesystem server
+    configs["filesystem"] = MCPServerConfig(
+        name="filesystem",
+        server_type=MCPServerType.FILESYSTEM,
+        command="npx",
+        args=[
+            "-y",
+            "@modelcontextprotocol/server-filesystem",
+            documents_dir,
+            cwd
+        ],
+        config={
+            "allowed_directories": [
+                documents_dir,
+                cwd
+            ]
+        }
+    )
+    
+    # Git server
+    configs["git"] = MCPServerConfig(
+        name="git",
+        server_type=MCPServerType.GIT,
+        command="npx",
+        args=[
+            "-y",
+            "@modelcontextprotocol/server-git"
+        ]
+    )
+    
+    # GitHub server
+    configs["github"] = MCPServerConfig(
+        name="github",
+        server_type=MCPServerType.GITHUB,
+        command="npx",
+        args=[
+            "-y",
+            "@modelcontextprotocol/server-github"
+        ],
+        env={
+            "GITHUB_TOKEN": github_token
+        }
+    )
+    
+    # Memory server
+    configs["memory"] = MCPServerConfig(
+        name="memory",
+        server_type=MCPServerType.MEMORY,
+        command="npx",
+        args=[
+            "-y",
+            "@modelcontextprotocol/server-memory"
+        ]
+    )
+    
+    # Playwright server (Microsoft official)
+    configs["playwright"] = MCPServerConfig(
+        name="playwright",
+        server_type=MCPServerType.PLAYWRIGHT,
+        command="npx",
+        args=[
+            "-y",
+            "@microsoft/playwright-mcp"
+        ],
+        config={
+            "headless": False,
+            "isolated": True
+        }
+    )
+    
+    # SQLite server
+    configs["sqlite"] = MCPServerConfig(
+        name="sqlite",
+        server_type=MCPServerType.SQLITE,
+        command="npx",
+        args=[
+            "-y",
+            "@modelcontextprotocol/server-sqlite",
+            osa_db
+        ],
+        config={
+            "database_path": osa_db
+        }
+    )
+    
+    return configs
+
+
 class MCPClient:
     """MCP Client for OSA to connect to various MCP servers"""
     
+    # Parsed user config files keyed by (path, mtime_ns), shared by all clients
+    _user_config_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.logger = logging.getLogger("OSA-MCP")
-        self.servers = {}
-        self.processes = {}
-        self.connected_servers = {}
+        self.handshake_timeout = self.config.get("handshake_timeout", 5.0)
+        self.request_timeout = self.config.get("request_timeout", 30.0)
+        
+        # Started servers by name. Each runtime has one reader task that
+        # resolves in-flight requests by JSON-RPC id, and one writer task
+        # that flushes queued requests with a single write + drain per batch
+        self._runtime: Dict[str, ServerRuntime] = {}
+        self._request_ids = itertools.count(1)
+        
+        # Short-lived LRU cache of read-only tool results: key -> (timestamp,
+        # serialized result). Hits are parsed afresh so callers can't alter
+        # what the next caller gets
+        self._tool_cache: "OrderedDict[Tuple, Tuple[float, bytes]]" = OrderedDict()
+        self._tool_cache_ttl = self.config.get("tool_cache_ttl", 1.0)
+        self._tool_cache_size = self.config.get("tool_cache_size", TOOL_CACHE_SIZE)
+        
+        # (timestamp, result) of the last get_all_server_status call
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         
         # Default MCP server configurations
         self.default_configs = self._get_default_configs()
@@ -69,115 +342,49 @@ class MCPClient:
         self.user_config_path = Path.home() / ".osa" / "mcp_config.json"
         self.load_user_config()
     
+    @property
+    def processes(self) -> Dict[str, "MCPServerProcess"]:
+        """Running server processes by name"""
+        return {name: runtime.process for name, runtime in self._runtime.items()}
+    
+    @property
+    def connected_servers(self) -> Dict[str, MCPServerConfig]:
+        """Configs of servers that completed the handshake, by name"""
+        return {name: runtime.config for name, runtime in self._runtime.items() if runtime.connected}
+    
+    def _is_connected(self, server_name: str) -> bool:
+        runtime = self._runtime.get(server_name)
+        return runtime is not None and runtime.connected
+    
     def _get_default_configs(self) -> Dict[str, MCPServerConfig]:
         """Get default MCP server configurations"""
-        configs = {}
-        
-        # Filesystem server
-        configs["filesystem"] = MCPServerConfig(
-            name="filesystem",
-            server_type=MCPServerType.FILESYSTEM,
-            command="npx",
-            args=[
-                "-y",
-                "@modelcontextprotocol/server-filesystem",
-                str(Path.home() / "Documents"),
-                str(Path.cwd())
-            ],
-            config={
-                "allowed_directories": [
-                    str(Path.home() / "Documents"),
-                    str(Path.cwd())
-                ]
-            }
-        )
-        
-        # Git server
-        configs["git"] = MCPServerConfig(
-            name="git",
-            server_type=MCPServerType.GIT,
-            command="npx",
-            args=[
-                "-y",
-                "@modelcontextprotocol/server-git"
-            ]
-        )
-        
-        # GitHub server
-        configs["github"] = MCPServerConfig(
-            name="github",
-            server_type=MCPServerType.GITHUB,
-            command="npx",
-            args=[
-                "-y",
-                "@modelcontextprotocol/server-github"
-            ],
-            env={
-                "GITHUB_TOKEN": os.getenv("GITHUB_TOKEN", "")
-            }
-        )
-        
-        # Memory server
-        configs["memory"] = MCPServerConfig(
-            name="memory",
-            server_type=MCPServerType.MEMORY,
-            command="npx",
-            args=[
-                "-y",
-                "@modelcontextprotocol/server-memory"
-            ]
-        )
-        
-        # Playwright server (Microsoft official)
-        configs["playwright"] = MCPServerConfig(
-            name="playwright",
-            server_type=MCPServerType.PLAYWRIGHT,
-            command="npx",
-            args=[
-                "-y",
-                "@microsoft/playwright-mcp"
-            ],
-            config={
-                "headless": False,
-                "isolated": True
-            }
-        )
-        
-        # SQLite server
-        configs["sqlite"] = MCPServerConfig(
-            name="sqlite",
-            server_type=MCPServerType.SQLITE,
-            command="npx",
-            args=[
-                "-y",
-                "@modelcontextprotocol/server-sqlite",
-                str(Path.home() / ".osa" / "osa.db")
-            ],
-            config={
-                "database_path": str(Path.home() / ".osa" / "osa.db")
-            }
-        )
-        
-        return configs
+        # Built per instance, load_user_config mutates these in place
+        return _build_default_configs()
     
     def load_user_config(self):
         """Load user-specific MCP configuration"""
         if self.user_config_path.exists():
             try:
-                with open(self.user_config_path, 'r') as f:
-                    user_config = json.load(f)
+                # Reuse the parsed file while its mtime is unchanged
+                stat = self.user_config_path.stat()
+                cache_key = (str(self.user_config_path), stat.st_mtime_ns)
+                user_config = MCPClient._user_config_cache.get(cache_key)
+                if user_config is None:
+                    with open(self.user_config_path, 'rb') as f:
+                        user_config = json_loads(f.read())
+                    MCPClient._user_config_cache[cache_key] = user_config
                     
-                # Merge with default configs
+                # Merge with default configs (copying, the cached dict is shared)
                 for server_name, server_config in user_config.get("servers", {}).items():
                     if server_name in self.default_configs:
                         # Update existing config
                         default = self.default_configs[server_name]
                         if "args" in server_config:
-                            default.args = server_config["args"]
+                            default.args = list(server_config["args"])
                         if "env" in server_config:
-                            default.env = server_config["env"]
+                            default.env = dict(server_config["env"] or {})
                         if "config" in server_config:
-                            default.config = server_config["config"]
+                            default.config = dict(server_config["config"] or {})
                         if "enabled" in server_config:
                             default.enabled = server_config["enabled"]
                     else:
@@ -186,9 +393,9 @@ class MCPClient:
                             name=server_name,
                             server_type=MCPServerType.CUSTOM,
                             command=server_config.get("command", "npx"),
-                            args=server_config.get("args", []),
-                            env=server_config.get("env", {}),
-                            config=server_config.get("config", {}),
+                            args=list(server_config.get("args", [])),
+                            env=dict(server_config.get("env") or {}),
+                            config=dict(server_config.get("config") or {}),
                             enabled=server_config.get("enabled", True)
                         )
                         
@@ -213,8 +420,16 @@ class MCPClient:
                 "auto_start": config.auto_start
             }
         
-        with open(self.user_config_path, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        new_content = json_dumps(config_data, indent=True)
+        
+        # Leave the file (and its mtime) alone when nothing changed
+        if self.user_config_path.exists() and self.user_config_path.read_bytes() == new_content:
+            return
+        
+        # Write to a temporary file and swap it in so readers never see a partial file
+        tmp_path = self.user_config_path.with_suffix(".tmp")
+        tmp_path.write_bytes(new_content)
+        os.replace(tmp_path, self.user_config_path)
     
     async def start_server(self, server_name: str) -> bool:
         """Start an MCP server"""
@@ -227,53 +442,192 @@ class MCPClient:
             self.logger.info(f"Server {server_name} is disabled")
             return False
         
-        if server_name in self.processes:
+        if server_name in self._runtime:
             self.logger.info(f"Server {server_name} is already running")
             return True
         
+        runtime = None
         try:
             # Prepare environment
             env = os.environ.copy()
-            if config.env:
-                env.update(config.env)
+            env.update(config.env)
             
             # Start the server process
             self.logger.info(f"Starting MCP server: {server_name}")
-            process = await asyncio.create_subprocess_exec(
-                config.command,
-                *config.args,
-                env=env,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                stdin=asyncio.subprocess.PIPE
-            )
+            process = await MCPServerProcess.spawn([config.command, *config.args], env)
             
-            self.processes[server_name] = process
+            runtime = ServerRuntime(config=config, process=process)
+            self._runtime[server_name] = runtime
+            self._status_cache = None
             
-            # Wait a bit for server to initialize
-            await asyncio.sleep(2)
-            
-            # Check if process is still running
-            if process.returncode is None:
+            # Wait for the server to answer the initialize handshake
+            if await self._initialize_server(server_name, process):
                 self.logger.info(f"✓ MCP server {server_name} started successfully")
-                self.connected_servers[server_name] = config
+                runtime.connected = True
+                runtime.write_queue = asyncio.Queue()
+                runtime.reader_task = asyncio.create_task(self._read_loop(server_name, runtime))
+                runtime.writer_task = asyncio.create_task(self._write_loop(server_name, runtime))
                 return True
-            else:
-                self.logger.error(f"MCP server {server_name} failed to start")
-                return False
+            
+            self.logger.error(f"MCP server {server_name} failed to start")
                 
         except Exception as e:
             self.logger.error(f"Failed to start MCP server {server_name}: {e}")
+        
+        # Drop the half-started server so a later start_server retries it
+        if runtime is not None:
+            await self._discard_runtime(server_name, runtime)
+        return False
+    
+    async def _discard_runtime(self, server_name: str, runtime: ServerRuntime):
+        """Forget a server that failed to start and kill its process"""
+        if self._runtime.get(server_name) is runtime:
+            del self._runtime[server_name]
+            self._status_cache = None
+        
+        process = runtime.process
+        try:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            process.close()
+        except Exception as e:
+            self.logger.warning(f"Failed to clean up MCP server {server_name}: {e}")
+    
+    async def _initialize_server(self, server_name: str, process) -> bool:
+        """Perform the MCP initialize handshake with a freshly started server"""
+        request = {
+            "jsonrpc": "2.0",
+            "id": 0,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": MCP_PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "osa", "version": "1.0.0"}
+            }
+        }
+        
+        try:
+            process.stdin.write(json_dumps(request) + b"\n")
+            await process.stdin.drain()
+            
+            # Race the reply against process exit so a server that crashes
+            # on launch is reported immediately rather than at the timeout
+            read_task = asyncio.ensure_future(_read_message(process.stdout))
+            exit_task = asyncio.ensure_future(process.wait())
+            done, pending = await asyncio.wait(
+                {read_task, exit_task},
+                timeout=self.handshake_timeout,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in pending:
+                task.cancel()
+            
+            if not done:
+                raise asyncio.TimeoutError()
+            if read_task not in done:
+                stderr = await asyncio.wait_for(process.stderr.read(4096), timeout=1)
+                self.logger.error(
+                    f"MCP server {server_name} exited with code {exit_task.result()}: "
+                    f"{stderr.decode(errors='replace').strip()}"
+                )
+                return False
+            
+            response_line = read_task.result()
+            if not response_line:
+                return False
+            
+            response = json_loads(response_line)
+            if "error" in response:
+                self.logger.error(f"MCP server {server_name} rejected initialize: {response['error']}")
+                return False
+            
+            # Tell the server we're ready for normal requests
+            notification = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+            process.stdin.write(json_dumps(notification) + b"\n")
+            await process.stdin.drain()
+            return True
+            
+        except asyncio.TimeoutError:
+            self.logger.error(f"MCP server {server_name} did not respond within {self.handshake_timeout}s")
             return False
+        except (ValueError, ConnectionError, EOFError) as e:
+            # EOFError covers IncompleteReadError from a truncated framed reply
+            self.logger.error(f"MCP server {server_name} handshake failed: {e}")
+            return False
+    
+    async def _read_loop(self, server_name: str, runtime: ServerRuntime):
+        """Read responses from a server and resolve the matching requests"""
+        process = runtime.process
+        pending = runtime.pending
+        try:
+            while True:
+                try:
+                    response_line = await _read_message(process.stdout)
+                except asyncio.IncompleteReadError:
+                    break
+                if not response_line:
+                    break
+                
+                try:
+                    response = json_loads(response_line)
+                except ValueError:
+                    self.logger.warning(f"Ignoring malformed output from {server_name}")
+                    continue
+                
+                # Notifications and server requests carry no id we're waiting on
+                future = pending.pop(response.get("id"), None) if isinstance(response, dict) else None
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            self._disconnect(server_name, runtime, ConnectionError(f"MCP server {server_name} closed its output"))
+    
+    async def _write_loop(self, server_name: str, runtime: ServerRuntime):
+        """Flush queued messages to a server, batching whatever is waiting"""
+        process = runtime.process
+        write_queue = runtime.write_queue
+        while True:
+            buffer = bytearray(await write_queue.get())
+            while not write_queue.empty() and len(buffer) < WRITE_BATCH_BYTES:
+                buffer.extend(write_queue.get_nowait())
+            
+            try:
+                process.stdin.write(buffer)
+                await process.stdin.drain()
+            except ConnectionError as e:
+                self._disconnect(server_name, runtime, e)
+                return
+    
+    def _disconnect(self, server_name: str, runtime: ServerRuntime, error: Exception):
+        """Stop routing requests to a server whose pipes have closed"""
+        if runtime.connected:
+            self.logger.warning(f"MCP server {server_name} disconnected: {error}")
+        runtime.connected = False
+        self._status_cache = None
+        
+        # Whichever of the reader and writer ended first takes the other down
+        current = asyncio.current_task()
+        for task in (runtime.reader_task, runtime.writer_task):
+            if task is not None and task is not current:
+                task.cancel()
+        self._fail_pending(runtime, error)
+    
+    def _fail_pending(self, runtime: ServerRuntime, error: Exception):
+        """Fail all in-flight requests for a server"""
+        for future in runtime.pending.values():
+            if not future.done():
+                future.set_exception(error)
+        runtime.pending.clear()
     
     async def stop_server(self, server_name: str) -> bool:
         """Stop an MCP server"""
-        if server_name not in self.processes:
+        runtime = self._runtime.get(server_name)
+        if runtime is None:
             self.logger.info(f"Server {server_name} is not running")
             return True
         
         try:
-            process = self.processes[server_name]
+            process = runtime.process
             process.terminate()
             
             # Wait for graceful shutdown
@@ -284,9 +638,16 @@ class MCPClient:
                 process.kill()
                 await process.wait()
             
-            del self.processes[server_name]
-            if server_name in self.connected_servers:
-                del self.connected_servers[server_name]
+            process.close()
+            del self._runtime[server_name]
+            self._status_cache = None
+            
+            runtime.connected = False
+            for task in (runtime.reader_task, runtime.writer_task):
+                if task is not None:
+                    task.cancel()
+            self._fail_pending(runtime, ConnectionError(f"MCP server {server_name} stopped"))
+            self._invalidate_tool_cache(server_name)
             
             self.logger.info(f"✓ MCP server {server_name} stopped")
             return True
@@ -305,21 +666,40 @@ class MCPClient:
         """Start all enabled MCP servers"""
         self.logger.info("Starting all enabled MCP servers...")
         
-        for server_name, config in self.default_configs.items():
-            if config.enabled and config.auto_start:
-                success = await self.start_server(server_name)
-                if not success:
-                    self.logger.warning(f"Failed to start {server_name}")
+        # Spawn servers concurrently so their startup waits overlap
+        server_names = [
+            server_name for server_name, config in self.default_configs.items()
+            if config.enabled and config.auto_start
+        ]
+        results = await asyncio.gather(
+            *(self.start_server(server_name) for server_name in server_names),
+            return_exceptions=True
+        )
+        
+        for server_name, result in zip(server_names, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Failed to start {server_name}: {result}")
+            elif not result:
+                self.logger.warning(f"Failed to start {server_name}")
         
-        self.logger.info(f"✓ Started {len(self.connected_servers)} MCP servers")
+        started = sum(1 for runtime in self._runtime.values() if runtime.connected)
+        self.logger.info(f"✓ Started {started} MCP servers")
     
     async def stop_all_servers(self):
         """Stop all running MCP servers"""
         self.logger.info("Stopping all MCP servers...")
         
-        server_names = list(self.processes.keys())
-        for server_name in server_names:
-            await self.stop_server(server_name)
+        # Stop servers concurrently, bounded so shutdown doesn't signal
+        # every process at once
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_STOPS)
+        
+        async def stop_bounded(server_name: str) -> bool:
+            async with semaphore:
+                return await self.stop_server(server_name)
+        
+        await asyncio.gather(
+            *(stop_bounded(server_name) for server_name in list(self._runtime.keys()))
+        )
         
         self.logger.info("✓ All MCP servers stopped")
     
@@ -329,7 +709,7 @@ class MCPClient:
             return {"status": "unknown", "error": "Server not configured"}
         
         config = self.default_configs[server_name]
-        is_running = server_name in self.processes
+        is_running = self._is_connected(server_name)
         
         return {
             "name": server_name,
@@ -342,57 +722,111 @@ class MCPClient:
     
     def get_all_server_status(self) -> Dict[str, Any]:
         """Get status of all MCP servers"""
-        return {
+        # Cached briefly for frequent polling; start/stop invalidate it
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < STATUS_CACHE_TTL:
+            return self._status_cache[1]
+        
+        status = {
             "total_configured": len(self.default_configs),
-            "total_running": len(self.processes),
+            "total_running": len(self.connected_servers),
             "servers": {
                 name: self.get_server_status(name)
                 for name in self.default_configs.keys()
             }
         }
+        self._status_cache = (now, status)
+        return status
     
     async def send_command(self, server_name: str, command: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Send a command to an MCP server"""
-        if server_name not in self.processes:
+        runtime = self._runtime.get(server_name)
+        if runtime is None or not runtime.connected:
             self.logger.error(f"Server {server_name} is not running")
             return None
         
+        pending = runtime.pending
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        pending[request_id] = future
+        
         try:
-            process = self.processes[server_name]
+            # Queue the command as JSON; the writer task sends it and the
+            # reader task delivers the response, so requests can overlap
+            message = {"jsonrpc": "2.0", **command, "id": request_id}
+            runtime.write_queue.put_nowait(json_dumps(message) + b"\n")
             
-            # Send command as JSON
-            command_json = json.dumps(command) + "\n"
-            process.stdin.write(command_json.encode())
-            await process.stdin.drain()
-            
-            # Read response
-            response_line = await process.stdout.readline()
-            if response_line:
-                return json.loads(response_line.decode())
-            
-            return None
+            return await asyncio.wait_for(future, timeout=self.request_timeout)
             
         except Exception as e:
             self.logger.error(f"Failed to send command to {server_name}: {e}")
             return None
+        finally:
+            pending.pop(request_id, None)
     
     async def call_tool(self, server_name: str, tool_name: str, params: Dict[str, Any] = None) -> Optional[Any]:
         """Call a tool on an MCP server"""
+        params = params or {}
+        
+        # Writes make cached reads from the same server stale
+        if tool_name not in CACHEABLE_TOOLS:
+            self._invalidate_tool_cache(server_name)
+        
+        cache_key = self._tool_cache_key(server_name, tool_name, params)
+        if cache_key is not None:
+            cached = self._cached_tool_result(cache_key)
+            if cached is not None:
+                return cached
+        
         command = {
             "method": "tools/call",
             "params": {
                 "name": tool_name,
-                "arguments": params or {}
+                "arguments": params
             }
         }
         
-        return await self.send_command(server_name, command)
+        result = await self.send_command(server_name, command)
+        if cache_key is not None and result is not None and "error" not in result:
+            self._tool_cache[cache_key] = (time.monotonic(), json_dumps(result))
+            self._tool_cache.move_to_end(cache_key)
+            while len(self._tool_cache) > self._tool_cache_size:
+                self._tool_cache.popitem(last=False)
+        return result
+    
+    def _cached_tool_result(self, cache_key: Tuple) -> Optional[Any]:
+        """Fresh copy of a cached tool result, dropping it once expired"""
+        cached = self._tool_cache.get(cache_key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= self._tool_cache_ttl:
+            del self._tool_cache[cache_key]
+            return None
+        self._tool_cache.move_to_end(cache_key)
+        return json_loads(cached[1])
+    
+    def _tool_cache_key(self, server_name: str, tool_name: str,
+                        params: Dict[str, Any]) -> Optional[Tuple]:
+        """Cache key for a read-only tool call, None if it can't be cached"""
+        if tool_name not in CACHEABLE_TOOLS:
+            return None
+        key = (server_name, tool_name, tuple(sorted(params.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _invalidate_tool_cache(self, server_name: str):
+        """Drop cached tool results for a server"""
+        for key in [key for key in self._tool_cache if key[0] == server_name]:
+            del self._tool_cache[key]
     
     # Convenience methods for common operations
     
     async def read_file(self, file_path: str) -> Optional[str]:
         """Read a file using filesystem MCP server"""
-        if "filesystem" not in self.connected_servers:
+        if not self._is_connected("filesystem"):
             await self.start_server("filesystem")
         
         result = await self.call_tool("filesystem", "read_file", {"path": file_path})
@@ -400,7 +834,7 @@ class MCPClient:
     
     async def write_file(self, file_path: str, content: str) -> bool:
         """Write a file using filesystem MCP server"""
-        if "filesystem" not in self.connected_servers:
+        if not self._is_connected("filesystem"):
             await self.start_server("filesystem")
         
         result = await self.call_tool("filesystem", "write_file", {
@@ -411,7 +845,7 @@ class MCPClient:
     
     async def git_status(self, repo_path: str = ".") -> Optional[str]:
         """Get git status using git MCP server"""
-        if "git" not in self.connected_servers:
+        if not self._is_connected("git"):
             await self.start_server("git")
         
         result = await self.call_tool("git", "status", {"path": repo_path})
@@ -419,7 +853,7 @@ class MCPClient:
     
     async def browse_web(self, url: str) -> Optional[str]:
         """Browse a webpage using Playwright MCP server"""
-        if "playwright" not in self.connected_servers:
+        if not self._is_connected("playwright"):
             await self.start_server("playwright")
         
         result = await self.call_tool("playwright", "navigate", {"url": url})
@@ -427,7 +861,7 @@ class MCPClient:
     
     async def query_memory(self, query: str) -> Optional[List[Dict[str, Any]]]:
         """Query the memory MCP server"""
-        if "memory" not in self.connected_servers:
+        if not self._is_connected("memory"):
             await self.start_server("memory")
         
         result = await self.call_tool("memory", "query", {"query": query})
@@ -435,7 +869,7 @@ class MCPClient:
     
     async def store_memory(self, key: str, value: Any, metadata: Dict[str, Any] = None) -> bool:
         """Store data in memory MCP server"""
-        if "memory" not in self.connected_servers:
+        if not self._is_connected("memory"):
             await self.start_server("memory")
         
         result = await self.call_tool("memory", "store", {
@@ -448,10 +882,13 @@ class MCPClient:
 
 # Create singleton instance
 _mcp_client = None
+_mcp_client_lock = threading.Lock()
 
 def get_mcp_client(config: Dict[str, Any] = None) -> MCPClient:
     """Get or create the global MCP client"""
     global _mcp_client
     if _mcp_client is None:
-        _mcp_client = MCPClient(config)
+        with _mcp_client_lock:
+            if _mcp_client is None:
+                _mcp_client = MCPClient(config)
     return _mcp_client
\ No newline at end of file
@@ -1,18 +1,24 @@
 """Adapter for using the extracted persistent-ai-memory module."""
 
+import functools
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 import os
 
-# AUTO-LOAD CRITICAL VISION ON IMPORT
+if TYPE_CHECKING:
+    from persistent_ai_memory import (
+        PersistentMemory,
+        Memory,
+        MemoryType,
+        MemoryPriority,
+        get_persistent_memory
+    )
+
+# CRITICAL VISION, loaded once by the OSA bootstrap (not on import)
+@functools.lru_cache(maxsize=None)
 def auto_load_vision():
-    """Automatically load OSA vision files to ensure context is never lost."""
-    vision_files = [
-        "/Users/MAC/Documents/projects/omnimind/OSA_ULTIMATE_VISION.md",
-        "/Users/MAC/Documents/projects/omnimind/OSA_CORE_VISION.md",
-        "/Users/MAC/Documents/projects/omnimind/OSA_ARCHITECTURE_PRINCIPLES.md"
-    ]
-    
+    """Load OSA vision files to ensure context is never lost (runs once)."""
     print("\n" + "="*60)
     print("🎯 OSA VISION AUTO-LOADED")
     print("="*60)
@@ -24,21 +30,32 @@ def auto_load_vision():
     os.environ["OSA_VISION_LOADED"] = "true"
     os.environ["OSA_GOAL"] = "100_AUTONOMOUS_100_ACCURATE_100_SECURE"
 
-# Auto-load on import
-auto_load_vision()
+# Names re-exported from the extracted module, imported on first access
+_LAZY_EXPORTS = {
+    "PersistentMemory",
+    "Memory",
+    "MemoryType",
+    "MemoryPriority",
+    "get_persistent_memory"
+}
 
-# Add module path (temporary until pip install)
-module_path = Path(__file__).parent.parent.parent / "modules" / "persistent-ai-memory" / "src"
-sys.path.insert(0, str(module_path))
 
-# Import from the extracted module
-from persistent_ai_memory import (
-    PersistentMemory,
-    Memory,
-    MemoryType,
-    MemoryPriority,
-    get_persistent_memory
-)
+def __getattr__(name):
+    """Import persistent_ai_memory lazily on first attribute access (PEP 562)."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    # Add module path (temporary until pip install)
+    module_path = str(Path(__file__).parent.parent.parent / "modules" / "persistent-ai-memory" / "src")
+    if module_path not in sys.path:
+        sys.path.insert(0, module_path)
+    
+    import persistent_ai_memory
+    
+    # Cache every export so later lookups bypass __getattr__
+    for export in _LAZY_EXPORTS:
+        globals()[export] = getattr(persistent_ai_memory, export)
+    return globals()[name]
 
 # Re-export for backward compatibility
 __all__ = [
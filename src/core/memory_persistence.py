@@ -5,6 +5,7 @@ Ensures context and learning persist across all sessions
 """
 
 import json
+import os
 import pickle
 import sqlite3
 from datetime import datetime
@@ -12,14 +13,327 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 import hashlib
 import asyncio
+import atexit
+import copy
+import functools
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
-import chromadb
-from chromadb.config import Settings
+
+# Memory IDs use xxhash when installed
+from ._compat import DATACLASS_SLOTS, short_id
+
+# The vector store is chromadb by default, or a bare hnswlib index
+try:
+    import chromadb
+    from chromadb.config import Settings
+    CHROMADB_AVAILABLE = True
+except ImportError:
+    CHROMADB_AVAILABLE = False
+
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+# ONNX Runtime encoding is optional, sentence-transformers is the default
+try:
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+CACHE_DTYPE = np.float16
+
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA cache_size=-65536",  # 64MB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+MEMORY_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_type_ts ON memories(memory_type, timestamp DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_type_reinforce ON memories(memory_type, reinforcement_score DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_type_accessed ON memories(memory_type, last_accessed DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_last_accessed ON memories(last_accessed)",
+    "CREATE INDEX IF NOT EXISTS idx_priority_rein ON memories(priority, reinforcement_score)",
+    "CREATE INDEX IF NOT EXISTS idx_skills_proficiency ON skills(proficiency DESC)",
+)
+
+# Hot-path statements are kept as fixed strings so sqlite3's statement
+# cache reuses their prepared plans instead of reparsing on every call
+SQL_INSERT_MEMORY = '''
+    INSERT OR REPLACE INTO memories 
+    (id, content, memory_type, priority, metadata, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+SQL_REINFORCE_MEMORY = '''
+    UPDATE memories 
+    SET reinforcement_score = reinforcement_score + ?
+    WHERE id = ?
+'''
+
+SQL_DECAY_MEMORIES = '''
+    UPDATE memories 
+    SET reinforcement_score = reinforcement_score * 0.99
+    WHERE last_accessed < datetime('now', '-7 days')
+    AND priority NOT IN ('critical', 'high')
+'''
+
+_WEAK_MEMORIES = "WHERE reinforcement_score < 0.1 AND priority = 'low'"
+SQL_DELETE_WEAK_MEMORIES = f"DELETE FROM memories {_WEAK_MEMORIES}"
+SQL_SELECT_WEAK_MEMORIES = f"SELECT id FROM memories {_WEAK_MEMORIES}"
+
+# DELETE ... RETURNING needs SQLite 3.35+
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+SQL_INSERT_SKILL = '''
+    INSERT OR REPLACE INTO skills 
+    (name, description, code_template, last_used)
+    VALUES (?, ?, ?, ?)
+'''
+
+
+# chromadb takes NumPy arrays directly from 0.5 on; 0.4.x only accepts
+# nested lists, so convert there, once per batch
+CHROMA_ACCEPTS_NDARRAY = not CHROMADB_AVAILABLE or (
+    tuple(int(part) for part in chromadb.__version__.split(".")[:2]) >= (0, 5)
+)
+
+
+def _chroma_embeddings(embeddings: np.ndarray):
+    """Embeddings batch in the form the installed chromadb accepts"""
+    return embeddings if CHROMA_ACCEPTS_NDARRAY else embeddings.tolist()
+
+
+def _content_key(content: str) -> str:
+    """Fast content hash used as the embedding cache key"""
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _synchronized(method):
+    """Run a PersistentMemory method holding the instance lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class HnswVectorStore:
+    """Chroma-collection-compatible vector store on a bare hnswlib index
+    
+    Implements the subset of the collection API PersistentMemory uses (add,
+    query, get, delete, count) without chromadb's client/server stack.
+    Memory ids are 16 hex characters, so each maps directly to a 64-bit
+    hnswlib label. Vectors live in index.bin; ids and metadata in meta.json,
+    both rewritten after every add or delete batch.
+    """
+    
+    def __init__(self, path: Path, space: str = "cosine", ef: int = 64,
+                 m: int = 16, ef_construction: int = 200):
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.path / "index.bin"
+        self.meta_file = self.path / "meta.json"
+        self.metadata = {"hnsw:space": space}
+        self.space = space
+        self.ef = ef
+        self.m = m
+        self.ef_construction = ef_construction
+        self.index = None
+        self.dim = None
+        self._entries: Dict[int, Dict[str, Any]] = {}  # label -> {"id", "metadata"}
+        self._lock = threading.Lock()
+        self._load()
+    
+    @staticmethod
+    def _label(memory_id: str) -> int:
+        """64-bit hnswlib label for a memory id"""
+        try:
+            if len(memory_id) == 16:
+                return int(memory_id, 16)
+        except ValueError:
+            pass
+        return int(short_id(memory_id), 16)
+    
+    def _load(self):
+        """Load a previously saved index"""
+        if not (self.index_file.exists() and self.meta_file.exists()):
+            return
+        meta = json.loads(self.meta_file.read_text())
+        self.dim = meta["dim"]
+        self.index = hnswlib.Index(space=self.space, dim=self.dim)
+        self.index.load_index(str(self.index_file), allow_replace_deleted=True)
+        self.index.set_ef(self.ef)
+        self._entries = {int(label): entry for label, entry in meta["entries"].items()}
+    
+    def save(self):
+        """Persist the index and its id/metadata map"""
+        with self._lock:
+            self._save()
+    
+    def _save(self):
+        """save() with the lock held; each file is replaced atomically"""
+        if self.index is None:
+            return
+        tmp = self.index_file.with_suffix(".tmp")
+        self.index.save_index(str(tmp))
+        os.replace(tmp, self.index_file)
+        tmp = self.meta_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps({
+            "dim": self.dim,
+            "entries": {str(label): entry for label, entry in self._entries.items()}
+        }))
+        os.replace(tmp, self.meta_file)
+    
+    def count(self) -> int:
+        return len(self._entries)
+    
+    def add(self, embeddings, ids: List[str], documents: List[str] = None,
+            metadatas: List[Dict[str, Any]] = None):
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        labels = np.array([self._label(memory_id) for memory_id in ids], dtype=np.uint64)
+        metadatas = metadatas or [{}] * len(ids)
+        with self._lock:
+            if self.index is None:
+                self.dim = embeddings.shape[1]
+                self.index = hnswlib.Index(space=self.space, dim=self.dim)
+                self.index.init_index(
+                    max_elements=max(1024, len(ids)), M=self.m,
+                    ef_construction=self.ef_construction, allow_replace_deleted=True
+                )
+                self.index.set_ef(self.ef)
+            needed = self.index.get_current_count() + len(ids)
+            if needed > self.index.get_max_elements():
+                self.index.resize_index(max(needed, 2 * self.index.get_max_elements()))
+            self.index.add_items(embeddings, labels, replace_deleted=True)
+            for label, memory_id, metadata in zip(labels.tolist(), ids, metadatas):
+                self._entries[label] = {"id": memory_id, "metadata": metadata}
+            self._save()
+    
+    def delete(self, ids: List[str]):
+        with self._lock:
+            for memory_id in ids:
+                label = self._label(memory_id)
+                if self._entries.pop(label, None) is not None:
+                    self.index.mark_deleted(label)
+            self._save()
+    
+    def get(self, ids: List[str], include: List[str] = None) -> Dict[str, Any]:
+        labels = [self._label(memory_id) for memory_id in ids]
+        labels = [label for label in labels if label in self._entries]
+        result = {"ids": [self._entries[label]["id"] for label in labels]}
+        if include and "embeddings" in include:
+            result["embeddings"] = (
+                np.asarray(self.index.get_items(labels), dtype=np.float32)
+                if labels else np.empty((0, self.dim or 0), dtype=np.float32)
+            )
+        return result
+    
+    def query(self, query_embeddings, n_results: int = 10,
+              where: Optional[Dict[str, Any]] = None,
+              include: List[str] = None) -> Dict[str, Any]:
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if self.index is None or not self._entries:
+            return {"ids": [[] for _ in queries], "distances": [[] for _ in queries]}
+        
+        allowed = None
+        if where:
+            allowed = lambda label: all(
+                self._entries.get(label, {}).get("metadata", {}).get(key) == value
+                for key, value in where.items()
+            )
+        
+        # hnswlib refuses to return fewer than k rows, which happens when a
+        # filter leaves too few candidates, so shrink k until it fits
+        k = min(n_results, len(self._entries))
+        while True:
+            try:
+                labels, distances = self.index.knn_query(queries, k=k, filter=allowed)
+                break
+            except RuntimeError:
+                if k <= 1:
+                    return {"ids": [[] for _ in queries], "distances": [[] for _ in queries]}
+                k //= 2
+        
+        return {
+            "ids": [[self._entries[label]["id"] for label in row] for row in labels.tolist()],
+            "distances": distances.tolist()
+        }
+
+
+class OnnxEmbedder:
+    """SentenceTransformer-compatible encoder running an ONNX export of the model"""
+    
+    max_seq_length = 256  # Same as the sentence-transformers config
+    
+    def __init__(self, model_name: str, model_dir: Path):
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = os.cpu_count() or 1
+        
+        # Export once, later sessions load the saved graph
+        export = not (model_dir / "model.onnx").exists()
+        source = f"sentence-transformers/{model_name}" if export else model_dir
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            source, export=export, provider="CPUExecutionProvider",
+            session_options=options
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(source)
+        if export:
+            self.model.save_pretrained(model_dir)
+            self.tokenizer.save_pretrained(model_dir)
+    
+    def encode(self, sentences, batch_size: int = 32, show_progress_bar: bool = False,
+               convert_to_numpy: bool = True, normalize_embeddings: bool = False) -> np.ndarray:
+        """Mean-pooled sentence embeddings, matching SentenceTransformer.encode"""
+        single = isinstance(sentences, str)
+        sentences = [sentences] if single else list(sentences)
+        
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            inputs = self.tokenizer(
+                sentences[start:start + batch_size], padding=True, truncation=True,
+                max_length=self.max_seq_length, return_tensors="np"
+            )
+            hidden = self.model(**inputs).last_hidden_state
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            batches.append((hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None))
+        
+        embeddings = np.concatenate(batches).astype(np.float32)
+        if normalize_embeddings:
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings[0] if single else embeddings
+
+
+@functools.lru_cache(maxsize=None)
+def _get_embedder(model_name: str, backend: str = "torch", model_dir: Optional[str] = None):
+    """Load an embedding model once per process and share it between instances"""
+    if backend == "onnx":
+        if ONNX_AVAILABLE:
+            return OnnxEmbedder(model_name, Path(model_dir))
+        logging.getLogger("OSA-Memory").warning(
+            "ONNX backend requested but optimum/onnxruntime are not installed, using torch"
+        )
+    return SentenceTransformer(model_name)
 
 
 class MemoryPriority(Enum):
@@ -42,7 +356,7 @@ class MemoryType(Enum):
     ERROR = "error"  # Mistakes to avoid
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Memory:
     """A single memory item"""
     id: str
@@ -50,7 +364,7 @@ class Memory:
     memory_type: MemoryType
     priority: MemoryPriority
     timestamp: datetime
-    embedding: Optional[List[float]] = None
+    embedding: Optional[np.ndarray] = None
     metadata: Dict[str, Any] = None
     access_count: int = 0
     last_accessed: Optional[datetime] = None
@@ -58,6 +372,24 @@ class Memory:
     reinforcement_score: float = 1.0  # How important this memory is
 
 
+def _merge_groups(pairs) -> Dict[int, List[int]]:
+    """Group indexes of similar memories from (i, j) pairs, i < j, in sorted order
+    
+    Each memory is merged into the earliest memory it is similar to that is
+    itself kept, so every member of a group is similar to the group's first
+    memory. Chains are not merged transitively: with a~b and b~c but not
+    a~c, b joins a and c stays on its own.
+    """
+    groups: Dict[int, List[int]] = {}
+    merged = set()
+    for i, j in pairs:
+        if i in merged or j in merged:
+            continue
+        groups.setdefault(i, [i]).append(j)
+        merged.add(j)
+    return groups
+
+
 class PersistentMemory:
     """Persistent memory system for OSA"""
     
@@ -77,30 +409,155 @@ class PersistentMemory:
         
         # SQLite for structured memory
         self.db_path = self.memory_dir / "memories.db"
-        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=256
+        )
         self._init_database()
         
-        # Vector store for semantic search
-        self.chroma_client = chromadb.PersistentClient(
-            path=str(self.memory_dir / "chroma")
-        )
-        self.collection = self.chroma_client.get_or_create_collection(
-            name="osa_memories",
-            metadata={"description": "OSA's persistent memory"}
+        # self.conn, the vector store and the embedding cache are shared by
+        # every thread calling in, so methods using them hold this lock
+        self._lock = threading.RLock()
+        
+        # Async callers hand SQLite work to worker threads: writes go through
+        # a single worker so they queue there rather than on the lock, reads
+        # use a read-only connection per thread so they can run alongside
+        self._write_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="osa-memory-writer"
         )
+        self._read_local = threading.local()
+        
+        # Vector store for semantic search
+        # ("hnswlib" swaps chromadb for a bare HNSW index on disk)
+        vector_store = self.config.get("vector_store", "chroma")
+        if vector_store == "hnswlib" or not CHROMADB_AVAILABLE:
+            if not HNSWLIB_AVAILABLE:
+                raise ImportError("Persistent memory needs chromadb or hnswlib installed")
+            self.chroma_client = None
+            self.collection = HnswVectorStore(self.memory_dir / "hnsw")
+        else:
+            self.chroma_client = chromadb.PersistentClient(
+                path=str(self.memory_dir / "chroma")
+            )
+            self.collection = self.chroma_client.get_or_create_collection(
+                name="osa_memories",
+                # Applies to newly created stores; an existing collection keeps
+                # the space it was built with (see _similar_pairs_from_index)
+                metadata={"description": "OSA's persistent memory", "hnsw:space": "cosine"}
+            )
+        
+        # Embedding model, shared across instances. "onnx" runs an ONNX
+        # Runtime export of the same model, which encodes several times faster
+        backend = self.config.get("embedding_backend", "torch")
+        onnx_dir = None
+        if backend == "onnx":
+            onnx_dir = str(self.config.get("onnx_model_dir", self.memory_dir / "onnx" / EMBEDDING_MODEL))
+        self.embedder = _get_embedder(EMBEDDING_MODEL, backend, onnx_dir)
         
-        # Embedding model
-        self.embedder = SentenceTransformer('all-MiniLM-L6-v2')
+        # LRU cache of normalized embeddings keyed by content hash, so
+        # repeated content (core vision, skills) is never re-encoded.
+        # Entries are held as float16, halving the cache's footprint; the
+        # rounding error is far below the compression threshold's margin
+        self.embedding_cache_file = self.memory_dir / "embedding_cache.npz"
+        self.embedding_cache_size = self.config.get("embedding_cache_size", 50000)
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._load_embedding_cache()
         
         # Memory compression settings
         self.max_memories = 10000
         self.compression_threshold = 0.8  # Similarity threshold for merging
+        self.compression_neighbors = 5  # Neighbors checked per memory via HNSW
+        
+        # Session context snapshot, reused for context_cache_ttl seconds and
+        # dropped whenever memories are written
+        self.context_cache_ttl = self.config.get("context_cache_ttl", 30.0)
+        self._context_cache: Optional[Dict[str, Any]] = None
+        self._context_cache_time = 0.0
+        self._context_generation = 0
+        # Held only around the snapshot itself, never by writers for the
+        # length of a write, so the event loop can check it without waiting
+        self._context_lock = threading.Lock()
         
         # Load core memories
         self._load_core_memories()
+        
+        self._closed = False
+        _open_memories.add(self)
+    
+    def _encode(self, contents: List[str]) -> np.ndarray:
+        """Normalized embeddings for contents, encoding only cache misses"""
+        keys = [_content_key(content) for content in contents]
+        
+        # Only exact repeats reuse an embedding: texts differing by a word
+        # or two ("do" / "do not") can mean opposite things
+        missing = OrderedDict()
+        for key, content in zip(keys, contents):
+            if key in self._embedding_cache:
+                self._embedding_cache.move_to_end(key)
+            else:
+                missing[key] = content
+        
+        if missing:
+            # Encode shortest first so each batch is padded only to the
+            # length of similar-sized texts
+            missing_keys = sorted(missing, key=lambda key: len(missing[key]))
+            encoded = self.embedder.encode(
+                [missing[key] for key in missing_keys],
+                batch_size=64,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+            for key, embedding in zip(missing_keys, encoded.astype(CACHE_DTYPE)):
+                self._embedding_cache[key] = embedding
+            while len(self._embedding_cache) > self.embedding_cache_size:
+                self._embedding_cache.popitem(last=False)
+        
+        return np.stack([self._embedding_cache[key] for key in keys]).astype(np.float32)
+    
+    def _load_embedding_cache(self):
+        """Load cached embeddings saved by a previous session"""
+        if not self.embedding_cache_file.exists():
+            return
+        try:
+            with np.load(self.embedding_cache_file) as data:
+                if str(data["model"]) != EMBEDDING_MODEL:
+                    return
+                for key, embedding in zip(data["keys"], data["embeddings"].astype(CACHE_DTYPE)):
+                    self._embedding_cache[str(key)] = embedding
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable embedding cache: {e}")
+    
+    @_synchronized
+    def save_embedding_cache(self):
+        """Persist the embedding cache for the next session"""
+        if not self._embedding_cache:
+            return
+        np.savez(
+            self.embedding_cache_file,
+            model=np.array(EMBEDDING_MODEL),
+            keys=np.array(list(self._embedding_cache.keys())),
+            embeddings=np.stack(list(self._embedding_cache.values()))
+        )
+    
+    def close(self):
+        """Save the embedding cache and release the database and writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        _open_memories.discard(self)
+        # Let queued writes finish before taking the lock they need
+        self._write_executor.shutdown(wait=True)
+        with self._lock:
+            self.save_embedding_cache()
+            self.conn.close()
     
     def _init_database(self):
         """Initialize SQLite database"""
+        # WAL lets readers run alongside the writer, and NORMAL sync is
+        # still crash-safe in WAL mode while avoiding an fsync per commit
+        for pragma in SQLITE_PRAGMAS:
+            self.conn.execute(pragma)
+        
         cursor = self.conn.cursor()
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS memories (
@@ -139,6 +596,18 @@ class PersistentMemory:
             )
         ''')
         
+        # Indexes matching the WHERE + ORDER BY of get_context_for_session
+        # and decay_memories, so those avoid full table scans
+        for index in MEMORY_INDEXES:
+            cursor.execute(index)
+        
+        # Populate sqlite_stat1 once so the planner can choose between them
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        )
+        if cursor.fetchone() is None:
+            cursor.execute("ANALYZE")
+        
         self.conn.commit()
     
     def _load_core_memories(self):
@@ -162,90 +631,109 @@ class PersistentMemory:
             "remember": "OSA creates tools, doesn't just use them"
         }
         
-        self.store_memory(
-            content=json.dumps(core_vision, indent=2),
-            memory_type=MemoryType.VISION,
-            priority=MemoryPriority.CRITICAL,
-            metadata={"permanent": True, "core": True}
+        self.bulk_store(
+            contents=[json.dumps(core_vision, indent=2)],
+            memory_types=[MemoryType.VISION],
+            priorities=[MemoryPriority.CRITICAL],
+            metadatas=[{"permanent": True, "core": True}]
         )
     
     def store_memory(self, content: str, memory_type: MemoryType, 
                     priority: MemoryPriority = MemoryPriority.MEDIUM,
                     metadata: Dict[str, Any] = None) -> str:
         """Store a new memory"""
-        # Generate ID
-        memory_id = hashlib.md5(
-            f"{content}{datetime.now().isoformat()}".encode()
-        ).hexdigest()[:16]
+        return self.bulk_store([content], [memory_type], [priority], [metadata])[0]
+    
+    @_synchronized
+    def bulk_store(self, contents: List[str], memory_types: List[MemoryType],
+                   priorities: Optional[List[MemoryPriority]] = None,
+                   metadatas: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[str]:
+        """Store several memories with one batched encode and one write per store"""
+        if not contents:
+            return []
+        priorities = priorities or [MemoryPriority.MEDIUM] * len(contents)
+        metadatas = metadatas or [None] * len(contents)
         
-        # Create embedding
-        embedding = self.embedder.encode(content).tolist()
+        # Generate IDs
+        timestamps = [datetime.now().isoformat() for _ in contents]
+        memory_ids = [
+            short_id(f"{content}{timestamp}")
+            for content, timestamp in zip(contents, timestamps)
+        ]
+        
+        # Create embeddings (normalized, so cosine is a dot product)
+        embeddings = self._encode(contents)
         
         # Store in SQLite
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO memories 
-            (id, content, memory_type, priority, metadata, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            memory_id,
-            content,
-            memory_type.value,
-            priority.value,
-            json.dumps(metadata) if metadata else None,
-            datetime.now().isoformat()
-        ))
-        self.conn.commit()
+        with self.conn:
+            self.conn.executemany(SQL_INSERT_MEMORY, [
+                (
+                    memory_id,
+                    content,
+                    memory_type.value,
+                    priority.value,
+                    json.dumps(metadata) if metadata else None,
+                    timestamp
+                )
+                for memory_id, content, memory_type, priority, metadata, timestamp
+                in zip(memory_ids, contents, memory_types, priorities, metadatas, timestamps)
+            ])
+        
+        self._invalidate_context()
         
         # Store in vector database
         self.collection.add(
-            embeddings=[embedding],
-            documents=[content],
-            metadatas=[{
-                "type": memory_type.value,
-                "priority": priority.value,
-                "timestamp": datetime.now().isoformat()
-            }],
-            ids=[memory_id]
+            embeddings=_chroma_embeddings(embeddings),
+            documents=list(contents),
+            metadatas=[
+                {
+                    "type": memory_type.value,
+                    "priority": priority.value,
+                    "timestamp": timestamp
+                }
+                for memory_type, priority, timestamp in zip(memory_types, priorities, timestamps)
+            ],
+            ids=memory_ids
         )
         
-        self.logger.info(f"Stored {memory_type.value} memory: {memory_id}")
-        return memory_id
+        for memory_id, memory_type in zip(memory_ids, memory_types):
+            self.logger.info(f"Stored {memory_type.value} memory: {memory_id}")
+        return memory_ids
     
+    @_synchronized
     def recall_memories(self, query: str, n_results: int = 5,
                        memory_type: Optional[MemoryType] = None) -> List[Memory]:
         """Recall relevant memories"""
         # Create query embedding
-        query_embedding = self.embedder.encode(query).tolist()
+        query_embedding = self.embedder.encode(
+            query, convert_to_numpy=True, normalize_embeddings=True
+        )
         
         # Search vector store
         where_clause = {"type": memory_type.value} if memory_type else None
         results = self.collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=_chroma_embeddings(query_embedding[np.newaxis, :]),
             n_results=n_results,
             where=where_clause
         )
         
         memories = []
         if results['ids'] and results['ids'][0]:
-            cursor = self.conn.cursor()
-            for idx, memory_id in enumerate(results['ids'][0]):
-                # Get full memory from SQLite
-                cursor.execute(
-                    "SELECT * FROM memories WHERE id = ?",
-                    (memory_id,)
+            ids = results['ids'][0]
+            placeholders = ",".join("?" * len(ids))
+            
+            # Fetch all hits in one query, then emit them in Chroma's rank order
+            # (the SQL only varies with n_results, so it stays statement-cached)
+            rows = {
+                row[0]: row
+                for row in self.conn.execute(
+                    f"SELECT * FROM memories WHERE id IN ({placeholders})", ids
                 )
-                row = cursor.fetchone()
-                
+            }
+            
+            for memory_id in ids:
+                row = rows.get(memory_id)
                 if row:
-                    # Update access count
-                    cursor.execute('''
-                        UPDATE memories 
-                        SET access_count = access_count + 1,
-                            last_accessed = ?
-                        WHERE id = ?
-                    ''', (datetime.now().isoformat(), memory_id))
-                    
                     memories.append(Memory(
                         id=row[0],
                         content=row[1],
@@ -259,12 +747,105 @@ class PersistentMemory:
                         reinforcement_score=row[9]
                     ))
             
+            # Update access counts for every hit at once
+            if rows:
+                self.conn.execute(f'''
+                    UPDATE memories 
+                    SET access_count = access_count + 1,
+                        last_accessed = ?
+                    WHERE id IN ({placeholders})
+                ''', [datetime.now().isoformat(), *ids])
+            
             self.conn.commit()
         
         return memories
     
+    def _read_conn(self) -> sqlite3.Connection:
+        """Read-only SQLite connection owned by the calling thread"""
+        conn = getattr(self._read_local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+            )
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._read_local.conn = conn
+        return conn
+    
+    async def _run_write(self, func, *args, **kwargs):
+        """Run a writing method on the serialized writer thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._write_executor, functools.partial(func, *args, **kwargs)
+        )
+    
+    async def store_memory_async(self, content: str, memory_type: MemoryType,
+                                 priority: MemoryPriority = MemoryPriority.MEDIUM,
+                                 metadata: Dict[str, Any] = None) -> str:
+        """store_memory without blocking the event loop"""
+        return await self._run_write(self.store_memory, content, memory_type, priority, metadata)
+    
+    async def bulk_store_async(self, contents: List[str], memory_types: List[MemoryType],
+                               priorities: Optional[List[MemoryPriority]] = None,
+                               metadatas: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[str]:
+        """bulk_store without blocking the event loop"""
+        return await self._run_write(self.bulk_store, contents, memory_types, priorities, metadatas)
+    
+    async def recall_memories_async(self, query: str, n_results: int = 5,
+                                    memory_type: Optional[MemoryType] = None) -> List[Memory]:
+        """recall_memories without blocking the event loop"""
+        # Recall bumps access counts, so it is a write
+        return await self._run_write(self.recall_memories, query, n_results, memory_type)
+    
+    async def compress_memories_async(self):
+        """compress_memories without blocking the event loop"""
+        return await self._run_write(self.compress_memories)
+    
+    async def get_context_for_session_async(self) -> Dict[str, Any]:
+        """get_context_for_session on a read-only connection in a worker thread"""
+        cached = self._cached_context()
+        if cached is not None:
+            return cached
+        generation = self._context_generation
+        loop = asyncio.get_running_loop()
+        context = await loop.run_in_executor(
+            None, lambda: self._query_context(self._read_conn())
+        )
+        return self._remember_context(context, generation)
+    
+    @_synchronized
     def get_context_for_session(self) -> Dict[str, Any]:
         """Get essential context for a new session"""
+        cached = self._cached_context()
+        if cached is not None:
+            return cached
+        generation = self._context_generation
+        return self._remember_context(self._query_context(self.conn), generation)
+    
+    def _cached_context(self) -> Optional[Dict[str, Any]]:
+        """Copy of the context snapshot while it is still fresh"""
+        with self._context_lock:
+            if (self._context_cache is not None
+                    and time.monotonic() - self._context_cache_time < self.context_cache_ttl):
+                return copy.deepcopy(self._context_cache)
+        return None
+    
+    def _remember_context(self, context: Dict[str, Any], generation: int) -> Dict[str, Any]:
+        """Keep a snapshot unless a write landed while it was being queried"""
+        snapshot = copy.deepcopy(context)
+        with self._context_lock:
+            if generation == self._context_generation:
+                self._context_cache = snapshot
+                self._context_cache_time = time.monotonic()
+        return context
+    
+    def _invalidate_context(self):
+        """Drop the context snapshot after memories change"""
+        with self._context_lock:
+            self._context_generation += 1
+            self._context_cache = None
+    
+    def _query_context(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """Run the session context queries on the given connection"""
         context = {
             "core_vision": [],
             "recent_decisions": [],
@@ -275,7 +856,7 @@ class PersistentMemory:
         }
         
         # Get core vision memories (CRITICAL priority)
-        cursor = self.conn.cursor()
+        cursor = conn.cursor()
         cursor.execute('''
             SELECT content FROM memories 
             WHERE priority = 'critical' AND memory_type = 'vision'
@@ -333,6 +914,7 @@ class PersistentMemory:
         
         return context
     
+    @_synchronized
     def compress_memories(self):
         """Compress similar memories to save space"""
         cursor = self.conn.cursor()
@@ -344,78 +926,110 @@ class PersistentMemory:
         if len(memories) <= self.max_memories:
             return
         
-        # Group similar memories
-        merged_count = 0
-        for i, (id1, content1) in enumerate(memories):
-            embedding1 = self.embedder.encode(content1)
-            
-            for j, (id2, content2) in enumerate(memories[i+1:], i+1):
-                embedding2 = self.embedder.encode(content2)
-                
-                # Calculate similarity
-                similarity = np.dot(embedding1, embedding2) / (
-                    np.linalg.norm(embedding1) * np.linalg.norm(embedding2)
-                )
-                
-                if similarity > self.compression_threshold:
-                    # Merge memories
-                    merged_content = f"[Merged] {content1}\n---\n{content2}"
-                    
-                    # Update first memory with merged content
-                    cursor.execute('''
-                        UPDATE memories 
-                        SET content = ?,
-                            reinforcement_score = reinforcement_score + 0.5
-                        WHERE id = ?
-                    ''', (merged_content, id1))
-                    
-                    # Delete second memory
-                    cursor.execute("DELETE FROM memories WHERE id = ?", (id2,))
-                    self.collection.delete(ids=[id2])
-                    
-                    merged_count += 1
+        ids = [row[0] for row in memories]
+        contents = [row[1] for row in memories]
+        
+        # Only stores past max_memories get here, far too many for all-pairs
+        # similarity, so ask the vector index for each memory's neighbors
+        pairs = self._similar_pairs_from_index(ids)
+        
+        groups = _merge_groups(pairs)
+        
+        # Merge each group into its first memory and delete the rest
+        updates = []
+        deleted_ids = []
+        for root, members in groups.items():
+            merged_content = "[Merged] " + "\n---\n".join(contents[i] for i in members)
+            updates.append((merged_content, 0.5 * (len(members) - 1), ids[root]))
+            deleted_ids.extend(ids[i] for i in members[1:])
+        
+        merged_count = len(deleted_ids)
+        if updates:
+            cursor.executemany('''
+                UPDATE memories 
+                SET content = ?,
+                    reinforcement_score = reinforcement_score + ?
+                WHERE id = ?
+            ''', updates)
+            cursor.executemany(
+                "DELETE FROM memories WHERE id = ?",
+                [(memory_id,) for memory_id in deleted_ids]
+            )
+            self.collection.delete(ids=deleted_ids)
         
         self.conn.commit()
+        self._invalidate_context()
         self.logger.info(f"Compressed {merged_count} similar memories")
     
+    def _similar_pairs_from_index(self, ids: List[str]) -> List[tuple]:
+        """Index pairs of memories above the compression threshold, via HNSW"""
+        position = {memory_id: i for i, memory_id in enumerate(ids)}
+        
+        # Chroma reports squared L2 by default; on unit vectors that is
+        # 2 - 2*cos, while the cosine/ip spaces report 1 - cos
+        space = (self.collection.metadata or {}).get("hnsw:space", "l2")
+        max_distance = (1 - self.compression_threshold) * (2 if space == "l2" else 1)
+        
+        pairs = set()
+        for start in range(0, len(ids), 256):
+            # Reuse the stored vectors instead of re-encoding
+            stored = self.collection.get(ids=ids[start:start + 256], include=["embeddings"])
+            if not stored["ids"]:
+                continue
+            results = self.collection.query(
+                query_embeddings=stored["embeddings"],
+                n_results=self.compression_neighbors + 1,
+                include=["distances"]
+            )
+            for memory_id, neighbor_ids, distances in zip(
+                stored["ids"], results["ids"], results["distances"]
+            ):
+                i = position.get(memory_id)
+                for neighbor_id, distance in zip(neighbor_ids, distances):
+                    j = position.get(neighbor_id)
+                    if i is not None and j is not None and i != j and distance < max_distance:
+                        pairs.add((min(i, j), max(i, j)))
+        
+        return sorted(pairs)
+    
+    @_synchronized
     def reinforce_memory(self, memory_id: str, score: float = 0.1):
         """Reinforce a memory when it's useful"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE memories 
-            SET reinforcement_score = reinforcement_score + ?
-            WHERE id = ?
-        ''', (score, memory_id))
+        self.conn.execute(SQL_REINFORCE_MEMORY, (score, memory_id))
         self.conn.commit()
+        self._invalidate_context()
     
+    @_synchronized
     def decay_memories(self):
         """Apply decay to old, unused memories"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE memories 
-            SET reinforcement_score = reinforcement_score * 0.99
-            WHERE last_accessed < datetime('now', '-7 days')
-            AND priority NOT IN ('critical', 'high')
-        ''')
-        
-        # Delete very weak memories
-        cursor.execute('''
-            DELETE FROM memories 
-            WHERE reinforcement_score < 0.1
-            AND priority = 'low'
-        ''')
+        with self.conn:
+            self.conn.execute(SQL_DECAY_MEMORIES)
+            
+            # Delete very weak memories, collecting their ids in the same pass
+            if SQLITE_HAS_RETURNING:
+                deleted_ids = [
+                    row[0] for row in
+                    self.conn.execute(f"{SQL_DELETE_WEAK_MEMORIES} RETURNING id")
+                ]
+            else:
+                deleted_ids = [row[0] for row in self.conn.execute(SQL_SELECT_WEAK_MEMORIES)]
+                self.conn.execute(SQL_DELETE_WEAK_MEMORIES)
+        self._invalidate_context()
         
-        self.conn.commit()
+        # Keep the vector store in step, in one batch
+        if deleted_ids:
+            self.collection.delete(ids=deleted_ids)
+            self.logger.info(f"Decayed away {len(deleted_ids)} weak memories")
     
+    @_synchronized
     def add_skill(self, name: str, description: str, code_template: str = None):
         """Add a new learned skill"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO skills 
-            (name, description, code_template, last_used)
-            VALUES (?, ?, ?, ?)
-        ''', (name, description, code_template, datetime.now().isoformat()))
+        self.conn.execute(
+            SQL_INSERT_SKILL,
+            (name, description, code_template, datetime.now().isoformat())
+        )
         self.conn.commit()
+        self._invalidate_context()
         
         # Also store as memory
         self.store_memory(
@@ -446,11 +1060,10 @@ class PersistentMemory:
         
         return "\n".join(summary)
     
+    @_synchronized
     def create_session_checkpoint(self, summary: str, key_decisions: List[str]):
         """Create a checkpoint for the current session"""
-        session_id = hashlib.md5(
-            f"session_{datetime.now().isoformat()}".encode()
-        ).hexdigest()[:16]
+        session_id = short_id(f"session_{datetime.now().isoformat()}")
         
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -471,6 +1084,16 @@ class PersistentMemory:
 # Singleton instance
 _persistent_memory = None
 
+# Instances not yet closed, closed by one exit hook without keeping them alive
+_open_memories: "weakref.WeakSet[PersistentMemory]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_memories():
+    for memory in list(_open_memories):
+        memory.close()
+
+
 def get_persistent_memory(config: Dict[str, Any] = None) -> PersistentMemory:
     """Get or create the global persistent memory"""
     global _persistent_memory
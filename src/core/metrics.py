@@ -12,8 +12,10 @@ from datetime import datetime
 from dataclasses import dataclass, field
 from collections import deque
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ResponseMetrics:
     """Metrics for a single response"""
     start_time: float = 0
@@ -51,7 +53,7 @@ class ResponseMetrics:
                 f"💾 {cache_str}")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SystemMetrics:
     """System-wide metrics and resource tracking"""
     cpu_percent: float = 0.0
@@ -64,11 +66,13 @@ class SystemMetrics:
     @classmethod
     def capture(cls) -> 'SystemMetrics':
         """Capture current system metrics"""
+        # Non-blocking: reports usage since the previous call, which
+        # MetricsTracker primes at startup
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
         
         return cls(
-            cpu_percent=psutil.cpu_percent(interval=0.1),
+            cpu_percent=psutil.cpu_percent(interval=None),
             memory_percent=memory.percent,
             memory_used_gb=memory.used / (1024**3),
             disk_usage_percent=disk.percent,
@@ -97,8 +101,13 @@ class MetricsTracker:
     def __init__(self, history_size: int = 100):
         self.current_response = ResponseMetrics()
         self.response_history = deque(maxlen=history_size)
+        # Running total over the response times in response_history, kept
+        # alongside it so get_session_stats doesn't rescan the history
+        self._response_times = deque(maxlen=history_size)
+        self._response_time_sum = 0.0
         self.system_metrics = SystemMetrics()
         self.session_start = time.time()
+        psutil.cpu_percent(interval=None)  # Prime the CPU delta for capture()
         self.total_tokens = 0
         self.total_responses = 0
         self.cache_hits = 0
@@ -109,6 +118,7 @@ class MetricsTracker:
         self.skills_learned = []
         self.knowledge_acquired = []
         self.patterns_recognized = []
+        self._pattern_index: Dict[str, Dict[str, Any]] = {}  # Same entries, by pattern
         
         # Background operations
         self.background_tasks = {}
@@ -142,6 +152,11 @@ class MetricsTracker:
             self.cache_misses += 1
         
         # Store in history
+        response_time = self.current_response.response_time
+        if len(self._response_times) == self._response_times.maxlen:
+            self._response_time_sum -= self._response_times[0]
+        self._response_times.append(response_time)
+        self._response_time_sum += response_time
         self.response_history.append(self.current_response)
         
         return self.current_response
@@ -165,18 +180,18 @@ class MetricsTracker:
     
     def add_pattern(self, pattern: str) -> None:
         """Track a recognized pattern"""
+        # Check if pattern already exists
+        existing = self._pattern_index.get(pattern)
+        if existing is not None:
+            existing["occurrences"] += 1
+            return
+        
         entry = {
             "pattern": pattern,
             "timestamp": datetime.now().isoformat(),
             "occurrences": 1
         }
-        
-        # Check if pattern already exists
-        for p in self.patterns_recognized:
-            if p["pattern"] == pattern:
-                p["occurrences"] += 1
-                return
-        
+        self._pattern_index[pattern] = entry
         self.patterns_recognized.append(entry)
     
     def add_background_task(self, task_id: str, description: str) -> None:
@@ -202,7 +217,7 @@ class MetricsTracker:
     def get_session_stats(self) -> Dict[str, Any]:
         """Get overall session statistics"""
         session_time = time.time() - self.session_start
-        avg_response_time = sum(r.response_time for r in self.response_history) / max(len(self.response_history), 1)
+        avg_response_time = self._response_time_sum / max(len(self._response_times), 1)
         cache_hit_rate = self.cache_hits / max(self.cache_hits + self.cache_misses, 1)
         
         return {
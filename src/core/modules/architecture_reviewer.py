@@ -17,21 +17,366 @@ Core Philosophy:
 """
 
 import asyncio
+import contextlib
+import copy
+import functools
 import json
-import hashlib
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta, time
+import os
+import sqlite3
+import sys
+import threading
+import time
+import weakref
+from typing import Deque, Dict, List, Mapping, Optional, Any, Sequence, Tuple
+from datetime import datetime, timedelta, time as daytime
 from pathlib import Path
+from secrets import token_hex
+from types import MappingProxyType
+from urllib.parse import urljoin, urlparse
+from xml.etree import ElementTree
 from dataclasses import dataclass, field
+from collections import deque
 from enum import Enum
 import logging
 import re
-from packaging import version
+
+import numpy as np
 
 # For web research
 import aiohttp
-from bs4 import BeautifulSoup
-import feedparser
+
+# json_dumps uses orjson for the status snapshot when installed
+from .._compat import DATACLASS_SLOTS, json_dumps
+
+# Aho-Corasick automaton for one-pass keyword matching of goals
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# selectolax (lexbor) parses HTML ~10x faster than BeautifulSoup, which is
+# only needed when selectolax is not installed
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    from bs4 import BeautifulSoup
+    SELECTOLAX_AVAILABLE = False
+
+
+# Bump when the shape of cached tool info changes; older rows are ignored
+TOOL_INFO_CACHE_VERSION = 2
+TOOL_INFO_CACHE_TTL = 6 * 3600  # GitHub stars/last push barely move within hours
+
+DAY_SECONDS = 86400
+
+# Components are due for review after a week
+REVIEW_INTERVAL = 7 * DAY_SECONDS
+
+# Goal keywords that signal a need for an existing tool
+_NEED_KEYWORDS = MappingProxyType({
+    'authentication': ('auth', 'login', 'user', 'signin'),
+    'database': ('database', 'data', 'store', 'persist'),
+    'payment': ('payment', 'billing', 'subscription', 'checkout'),
+    'email': ('email', 'mail', 'notification', 'send'),
+    'deployment': ('deploy', 'host', 'launch', 'publish'),
+    'monitoring': ('monitor', 'track', 'analytics', 'metrics'),
+    'testing': ('test', 'quality', 'validation')
+})
+
+
+# One bit per need; matches OR into a mask that is decoded in need order
+_NEED_BITS = MappingProxyType({need: 1 << i for i, need in enumerate(_NEED_KEYWORDS)})
+
+
+def _build_need_automaton():
+    """Automaton mapping every need keyword to its need's bit"""
+    automaton = ahocorasick.Automaton()
+    for need, keywords in _NEED_KEYWORDS.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, _NEED_BITS[need])
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_need_scan():
+    """Single pattern finding need keywords at every goal position.
+    
+    The lookahead makes matches overlap, keeping substring semantics. A
+    position reports only one alternative, so no keyword may be a prefix of
+    another need's keyword.
+    """
+    for need, keywords in _NEED_KEYWORDS.items():
+        for other, other_keywords in _NEED_KEYWORDS.items():
+            if other != need and any(o.startswith(k) for k in keywords for o in other_keywords):
+                raise ValueError(f"Need keywords of {need!r} prefix those of {other!r}")
+    groups = (
+        f"(?P<{need}>{'|'.join(map(re.escape, keywords))})"
+        for need, keywords in _NEED_KEYWORDS.items()
+    )
+    return re.compile(f"(?=(?:{'|'.join(groups)}))")
+
+
+_NEED_AUTOMATON = _build_need_automaton() if AHOCORASICK_AVAILABLE else None
+_NEED_SCAN = _build_need_scan()
+
+def _tool(name: str, url: str) -> Mapping[str, str]:
+    """Read-only knowledge base entry with interned strings, so repeated
+    names/URLs (e.g. Railway, Supabase) share one object"""
+    return MappingProxyType({
+        'name': sys.intern(name),
+        'url': sys.intern(url),
+        'name_lower': sys.intern(name.lower())
+    })
+
+
+# Knowledge base of existing tools per need, searched before any custom build
+_TOOL_DATABASE = MappingProxyType({
+    'authentication': (
+        _tool('Clerk', 'https://clerk.dev'),
+        _tool('Auth0', 'https://auth0.com'),
+        _tool('Supabase Auth', 'https://supabase.com'),
+        _tool('Firebase Auth', 'https://firebase.google.com'),
+        _tool('Lucia', 'https://lucia-auth.com')
+    ),
+    'database': (
+        _tool('Supabase', 'https://supabase.com'),
+        _tool('PlanetScale', 'https://planetscale.com'),
+        _tool('Neon', 'https://neon.tech'),
+        _tool('Railway', 'https://railway.app'),
+        _tool('Turso', 'https://turso.tech')
+    ),
+    'deployment': (
+        _tool('Vercel', 'https://vercel.com'),
+        _tool('Netlify', 'https://netlify.com'),
+        _tool('Railway', 'https://railway.app'),
+        _tool('Fly.io', 'https://fly.io'),
+        _tool('Render', 'https://render.com')
+    ),
+    'payment': (
+        _tool('Stripe', 'https://stripe.com'),
+        _tool('Lemonsqueezy', 'https://lemonsqueezy.com'),
+        _tool('Paddle', 'https://paddle.com'),
+        _tool('PayPal', 'https://paypal.com')
+    ),
+    'email': (
+        _tool('Resend', 'https://resend.com'),
+        _tool('SendGrid', 'https://sendgrid.com'),
+        _tool('Postmark', 'https://postmarkapp.com'),
+        _tool('AWS SES', 'https://aws.amazon.com/ses')
+    )
+})
+
+# Category name and its '_'-separated words, split once
+_CATEGORY_MATCH = tuple(
+    (category, tuple(category.split('_')), tools)
+    for category, tools in _TOOL_DATABASE.items()
+)
+
+# Inverted index for the keyword fallback: every substring of every tool
+# name maps to the tools' positions in knowledge base order
+_ALL_TOOLS = tuple(tool for tools in _TOOL_DATABASE.values() for tool in tools)
+
+
+def _build_name_index() -> Mapping[str, Tuple[int, ...]]:
+    """Substring -> positions in _ALL_TOOLS of the tools whose name contains it"""
+    index: Dict[str, List[int]] = {}
+    for position, tool in enumerate(_ALL_TOOLS):
+        name = tool['name_lower']
+        substrings = {name[i:j] for i in range(len(name)) for j in range(i + 1, len(name) + 1)}
+        for substring in substrings:
+            index.setdefault(substring, []).append(position)
+    return MappingProxyType({key: tuple(positions) for key, positions in index.items()})
+
+
+_NAME_INDEX = _build_name_index()
+
+# Shape of a research result, copied rather than rebuilt per research
+_EMPTY_RESEARCH = MappingProxyType({
+    'need': '',
+    'recommended_tools': (),
+    'build_vs_buy': 'buy',  # Default to using existing tools
+    'reasoning': ()
+})
+
+# Researched needs kept per reviewer; results follow the tool info refresh.
+# Only a handful of needs exist, so this effectively never evicts.
+RESEARCH_CACHE_SIZE = 1024
+RESEARCH_CACHE_TTL = TOOL_INFO_CACHE_TTL
+
+# Repositories requested per GitHub GraphQL query
+GRAPHQL_BATCH_SIZE = 50
+
+# Seconds a serialized status snapshot is reused between component changes
+STATUS_SNAPSHOT_TTL = 60
+
+# Mock tool data used until live research is enabled. Commit recency is
+# stored as an age, turned into a timestamp only when a lookup is made
+_KNOWN_TOOLS = MappingProxyType({
+    'FastAPI': {
+        'github_stars': 65000,
+        'last_commit_age': timedelta(days=1),
+        'documentation_quality': 'excellent',
+        'learning_curve': 'moderate',
+        'integrations': 50
+    },
+    'Next.js': {
+        'github_stars': 115000,
+        'last_commit_age': timedelta(hours=6),
+        'documentation_quality': 'excellent',
+        'learning_curve': 'moderate',
+        'integrations': 100
+    },
+    'Supabase': {
+        'github_stars': 60000,
+        'last_commit_age': timedelta(hours=12),
+        'documentation_quality': 'good',
+        'learning_curve': 'easy',
+        'integrations': 30
+    },
+    'Vercel': {
+        'github_stars': 12000,
+        'last_commit_age': timedelta(days=2),
+        'documentation_quality': 'excellent',
+        'learning_curve': 'easy',
+        'integrations': 50
+    },
+    'Railway': {
+        'github_stars': 3000,
+        'last_commit_age': timedelta(days=3),
+        'documentation_quality': 'good',
+        'learning_curve': 'easy',
+        'integrations': 25
+    },
+    'Clerk': {
+        'github_stars': 5000,
+        'last_commit_age': timedelta(days=1),
+        'documentation_quality': 'excellent',
+        'learning_curve': 'easy',
+        'integrations': 20
+    }
+})
+
+_DEFAULT_TOOL_INFO = MappingProxyType({
+    'github_stars': 1000,
+    'last_commit_age': timedelta(days=30),
+    'documentation_quality': 'unknown',
+    'learning_curve': 'moderate',
+    'integrations': 5
+})
+
+# Default factor by which an alternative must outscore the current tool.
+# Scores are capped at 1.0, so a current tool at or above 1/margin is final.
+BETTER_TOOL_MARGIN = 1.1
+
+# Default bars below which known alternatives are not worth a network
+# evaluation (0 stars / no age limit turns the pre-filter off)
+MIN_ALTERNATIVE_STARS = 1000
+MAX_ALTERNATIVE_AGE = timedelta(days=180)
+
+# Adoption signals in a discovery's reason/name, matched without lowercasing
+_BETTER_RE = re.compile(r'better', re.IGNORECASE)
+_FRAMEWORK_RE = re.compile(r'framework', re.IGNORECASE)
+
+# Tool/principle name checks, compiled once instead of lowercasing per call
+_FAST_RE = re.compile(r'fast', re.IGNORECASE)
+_SOLUTION_RE = re.compile(r'framework|platform', re.IGNORECASE)
+_CUSTOM_RE = re.compile(r'custom coding', re.IGNORECASE)
+_CLOUD_RE = re.compile(r'cloud|vercel', re.IGNORECASE)
+_SERVERLESS_RE = re.compile(r'vercel|lambda', re.IGNORECASE)
+
+
+def _versioned_cache(version_attr: str):
+    """Memoize a method per argument tuple until the instance's version_attr changes"""
+    def decorator(method):
+        cache_attr = f'_{method.__name__}_cache'
+        
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            version = getattr(self, version_attr)
+            cached = getattr(self, cache_attr, None)
+            if cached is None or cached[0] != version:
+                cached = (version, {})
+                setattr(self, cache_attr, cached)
+            results = cached[1]
+            if args not in results:
+                results[args] = method(self, *args)
+            return results[args]
+        return wrapper
+    return decorator
+
+
+class _LFUEntries:
+    """Completed results of one _async_lfu_cache method on one instance"""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        # key -> [created, result, hits]; dicts keep insertion order, so
+        # ties in hits evict the oldest key
+        self.entries: Dict[Any, list] = {}
+        # Tasks belong to the loop that created them: loop -> {key: task}
+        self.inflight = weakref.WeakKeyDictionary()
+        self.insertions = 0
+    
+    def store(self, cache_key, result):
+        """Cache a result, evicting the least frequently used key when full"""
+        old = self.entries.pop(cache_key, None)
+        if old is None and len(self.entries) >= self.maxsize:
+            del self.entries[min(self.entries, key=lambda k: self.entries[k][2])]
+        # A refreshed key keeps its hit count
+        self.entries[cache_key] = [time.monotonic(), result, old[2] if old is not None else 1]
+        
+        # Halve every count once per maxsize insertions, so keys that were
+        # popular long ago do not stay cached forever
+        self.insertions += 1
+        if self.insertions >= self.maxsize:
+            self.insertions = 0
+            for entry in self.entries.values():
+                entry[2] //= 2
+
+
+def _async_lfu_cache(maxsize: int, ttl: float, key=lambda self, *args: args):
+    """Memoize a coroutine method per key(self, *args) with a TTL, evicting the
+    least frequently used key when full. Concurrent calls for the same key on
+    the same event loop share one in-flight task."""
+    def decorator(method):
+        cache_attr = f'_{method.__name__}_cache'
+        
+        @functools.wraps(method)
+        async def wrapper(self, *args):
+            cache = getattr(self, cache_attr, None)
+            if cache is None:
+                cache = _LFUEntries(maxsize)
+                setattr(self, cache_attr, cache)
+            
+            cache_key = key(self, *args)
+            entry = cache.entries.get(cache_key)
+            if entry is not None:
+                entry[2] += 1
+                if time.monotonic() - entry[0] <= ttl:
+                    return entry[1]
+            
+            loop = asyncio.get_running_loop()
+            tasks = cache.inflight.setdefault(loop, {})
+            task = tasks.get(cache_key)
+            if task is None:
+                task = loop.create_task(method(self, *args))
+                tasks[cache_key] = task
+                
+                def done(task, cache_key=cache_key):
+                    if tasks.get(cache_key) is task:
+                        del tasks[cache_key]
+                    # Failures and cancellations are not cached
+                    if not task.cancelled() and task.exception() is None:
+                        cache.store(cache_key, task.result())
+                
+                task.add_done_callback(done)
+            
+            # A cancelled caller must not cancel the task others share
+            return await asyncio.shield(task)
+        return wrapper
+    return decorator
 
 
 class ReviewCategory(Enum):
@@ -46,7 +391,7 @@ class ReviewCategory(Enum):
     COST = "cost"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ArchitectureComponent:
     """Represents a component in OSA's architecture"""
     name: str
@@ -54,18 +399,26 @@ class ArchitectureComponent:
     current_version: str
     current_tool: str
     purpose: str
-    last_reviewed: datetime
+    last_reviewed_ts: float  # epoch seconds
     performance_score: float
     alternatives: List[Dict] = field(default_factory=list)
     issues: List[str] = field(default_factory=list)
     
+    @property
+    def last_reviewed(self) -> datetime:
+        """Last review time as a datetime"""
+        return datetime.fromtimestamp(self.last_reviewed_ts)
+    
+    @last_reviewed.setter
+    def last_reviewed(self, value: datetime):
+        self.last_reviewed_ts = value.timestamp()
+    
     def needs_review(self) -> bool:
         """Check if component needs review"""
-        days_since_review = (datetime.now() - self.last_reviewed).days
-        return days_since_review > 7 or self.performance_score < 0.7
+        return time.time() - self.last_reviewed_ts > REVIEW_INTERVAL or self.performance_score < 0.7
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ToolEvaluation:
     """Evaluation of a tool or technology"""
     name: str
@@ -80,22 +433,87 @@ class ToolEvaluation:
     documentation_quality: Optional[str] = None
     learning_curve: Optional[str] = None
     
-    def is_better_than(self, other: 'ToolEvaluation') -> bool:
+    def is_better_than(self, other: 'ToolEvaluation', margin: float = BETTER_TOOL_MARGIN) -> bool:
         """Compare with another tool"""
-        return self.score > other.score * 1.1  # 10% better threshold
+        return self.score > other.score * margin
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class ActionItem:
+    """Follow-up action produced by a review"""
+    action: str
+    target: str
+    reason: str = ''
+    priority: str = 'medium'
+    metric: Optional[str] = None
+    current: Optional[float] = None
+    target_value: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class AlternativeScore:
+    """Score of one alternative evaluated against the current tool"""
+    name: str
+    score: float
+    better: bool
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class Improvement:
+    """Improvement found while reviewing a component"""
+    component: str
+    current_tool: str
+    issues: Tuple[str, ...] = ()
+    alternatives_evaluated: Tuple[AlternativeScore, ...] = ()
+    replacement: Optional[str] = None
+    improvement_score: float = 0.0
+    reasons: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class ToolReplacement:
+    """Tool swapped in for a component"""
+    component: str
+    old: str
+    new: str
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ArchitectureReview:
     """Daily architecture review results"""
     id: str
     timestamp: datetime
     components_reviewed: List[str]
-    improvements_found: List[Dict]
+    improvements_found: List[Improvement]
     tools_to_replace: Dict[str, str]
     patterns_to_adopt: List[str]
     estimated_improvement: float
-    action_items: List[Dict]
+    action_items: List[ActionItem]
+
+
+class RateLimiter:
+    """Token bucket allowing a steady request rate with short bursts"""
+    
+    def __init__(self, requests_per_second: float, burst: Optional[float] = None):
+        self.rate = requests_per_second
+        self.capacity = burst if burst is not None else max(1.0, requests_per_second)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+    
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
 
 
 class DailyArchitectureReviewer:
@@ -107,10 +525,13 @@ class DailyArchitectureReviewer:
     - Stays current with best practices
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrent: int = 20,
+                 better_tool_margin: float = BETTER_TOOL_MARGIN,
+                 min_alternative_stars: int = MIN_ALTERNATIVE_STARS,
+                 max_alternative_age: Optional[timedelta] = MAX_ALTERNATIVE_AGE):
         # Architecture inventory
         self.components: Dict[str, ArchitectureComponent] = {}
-        self.reviews: List[ArchitectureReview] = []
+        self.reviews: Deque[ArchitectureReview] = deque(maxlen=90)  # Recent reviews only
         
         # Research sources
         self.research_sources = {
@@ -125,6 +546,12 @@ class DailyArchitectureReviewer:
             'pypi_stats': 'https://pypistats.org'
         }
         
+        # RSS/Atom feeds streamed during live research
+        self.research_feeds = {
+            'hackernews': 'https://hnrss.org/frontpage',
+            'dev_to': 'https://dev.to/feed'
+        }
+        
         # Best practices knowledge base
         self.best_practices = {
             'patterns': [
@@ -194,13 +621,79 @@ class DailyArchitectureReviewer:
         
         # Review schedule
         self.review_schedule = {
-            'daily': time(2, 0),  # 2 AM daily
+            'daily': daytime(2, 0),  # 2 AM daily
             'enabled': True,
             'last_review': None
         }
         
-        # Setup logging
-        self.logger = logging.getLogger('OSA-ArchitectureReview')
+        # Setup logging. As a child of 'OSA', records propagate to OSALogger's
+        # queue listener when it is running, so file I/O stays off the event
+        # loop, and to the root handlers otherwise
+        self.logger = logging.getLogger('OSA.ArchitectureReview')
+        
+        # Bumped whenever components or their scores change, so derived
+        # values (e.g. the score array) are only recomputed when stale
+        self._components_version = 0
+        self._score_cache: Optional[Tuple[int, List[str], np.ndarray]] = None
+        self._status_cache: Optional[Tuple[Tuple[int, Optional[datetime]], float, bytes]] = None
+        
+        # Bound on concurrent outbound requests during a review; the semaphore
+        # is created on first use so it binds to the loop running the review
+        self.max_concurrent = max_concurrent
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        
+        # Replacement threshold and the pre-filter on known alternatives
+        # (max_alternative_age=None means no age limit)
+        self.better_tool_margin = better_tool_margin
+        self.min_alternative_stars = min_alternative_stars
+        self.max_alternative_age = max_alternative_age
+        
+        # Per-host request rates (requests/second, burst). GitHub allows 60
+        # requests/hour unauthenticated and 5000/hour with a token
+        github_rate = (1.0, 10) if os.getenv('GITHUB_TOKEN') else (60 / 3600, 60)
+        self.rate_limits: Dict[str, Tuple[float, float]] = {'api.github.com': github_rate}
+        self.default_rate_limit = (5.0, 5)
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        
+        # Live GitHub lookups are opt-in; all requests share one pooled session
+        self.live_research = os.getenv('OSA_LIVE_RESEARCH') == '1'
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # On-disk cache of live lookups, so daily reviews reuse recent results
+        self.tool_cache_path = Path.home() / '.osa' / 'arch_review_cache.sqlite'
+        self._tool_cache: Optional[Dict[str, Tuple[float, Dict[str, Any]]]] = None
+        self._tool_cache_conn: Optional[sqlite3.Connection] = None
+        self._tool_cache_lock = threading.Lock()
+        self._tool_cache_loading: Optional[asyncio.Lock] = None
+        self.tool_repositories = {
+            'FastAPI': 'tiangolo/fastapi',
+            'Next.js': 'vercel/next.js',
+            'Supabase': 'supabase/supabase',
+            'Hasura': 'hasura/graphql-engine',
+            'Directus': 'directus/directus',
+            'Remix': 'remix-run/remix',
+            'SvelteKit': 'sveltejs/kit',
+            'Astro': 'withastro/astro',
+            'Nuxt': 'nuxt/nuxt',
+            'CockroachDB': 'cockroachdb/cockroach',
+            'EdgeDB': 'edgedb/edgedb',
+            'Neon': 'neondatabase/neon',
+            'Clerk': 'clerk/javascript',
+            'Lucia': 'lucia-auth/lucia',
+            'Vercel': 'vercel/vercel',
+            'Railway': 'railwayapp/cli',
+            'LangChain': 'langchain-ai/langchain',
+            'Haystack': 'deepset-ai/haystack',
+            'LlamaIndex': 'run-llama/llama_index',
+            'Semantic Kernel': 'microsoft/semantic-kernel',
+            'AutoGen': 'microsoft/autogen',
+            'Sentry': 'getsentry/sentry',
+            'Playwright': 'microsoft/playwright',
+            'Cypress': 'cypress-io/cypress',
+            'TestCafe': 'DevExpress/testcafe',
+            'Puppeteer': 'puppeteer/puppeteer',
+            'WebdriverIO': 'webdriverio/webdriverio'
+        }
         
         # Initialize components
         self._initialize_architecture()
@@ -215,11 +708,12 @@ class DailyArchitectureReviewer:
                 current_version='latest',
                 current_tool=config['current'],
                 purpose=category.replace('_', ' '),
-                last_reviewed=datetime.now() - timedelta(days=8),  # Force initial review
+                last_reviewed_ts=time.time() - 8 * DAY_SECONDS,  # Force initial review
                 performance_score=0.8,
                 alternatives=[{'name': alt} for alt in config['alternatives']]
             )
             self.components[category] = component
+        self._components_version += 1
     
     async def perform_daily_review(self) -> ArchitectureReview:
         """
@@ -231,7 +725,7 @@ class DailyArchitectureReviewer:
         self.logger.info("🔍 Starting daily architecture review...")
         
         review = ArchitectureReview(
-            id=hashlib.md5(f"review_{datetime.now()}".encode()).hexdigest()[:8],
+            id=token_hex(4),
             timestamp=datetime.now(),
             components_reviewed=[],
             improvements_found=[],
@@ -241,51 +735,68 @@ class DailyArchitectureReviewer:
             action_items=[]
         )
         
-        # Phase 1: Review each component
-        for component_name, component in self.components.items():
-            if component.needs_review():
-                self.logger.info(f"  Reviewing: {component_name}")
+        # Warm the GitHub cache for every tool in one batched query
+        if self.live_research:
+            await self._prefetch_github_info()
+        
+        # Phase 1: Review each component (concurrently, lookups are I/O bound)
+        to_review = [
+            (component_name, component)
+            for component_name, component in self.components.items()
+            if component.needs_review()
+        ]
+        if self.logger.isEnabledFor(logging.INFO):
+            for component_name, _ in to_review:
+                self.logger.info("  Reviewing: %s", component_name)
+        
+        results = await asyncio.gather(
+            *(self._review_component(component) for _, component in to_review),
+            return_exceptions=True
+        )
+        
+        for (component_name, _), improvement in zip(to_review, results):
+            if isinstance(improvement, Exception):
+                self.logger.error("  Failed to review %s: %s", component_name, improvement)
+                continue
+            if improvement:
+                review.improvements_found.append(improvement)
+                review.components_reviewed.append(component_name)
                 
-                improvement = await self._review_component(component)
-                if improvement:
-                    review.improvements_found.append(improvement)
-                    review.components_reviewed.append(component_name)
-                    
-                    if improvement.get('replacement'):
-                        review.tools_to_replace[component_name] = improvement['replacement']
+                if improvement.replacement:
+                    review.tools_to_replace[component_name] = improvement.replacement
         
         # Phase 2: Research new patterns and tools
         new_discoveries = await self._research_new_tools()
         for discovery in new_discoveries:
             if self._should_adopt(discovery):
                 review.patterns_to_adopt.append(discovery['name'])
-                review.action_items.append({
-                    'action': 'evaluate',
-                    'target': discovery['name'],
-                    'reason': discovery.get('reason', 'Promising new technology')
-                })
+                review.action_items.append(ActionItem(
+                    'evaluate',
+                    discovery['name'],
+                    reason=discovery.get('reason', 'Promising new technology')
+                ))
         
         # Phase 3: Check industry best practices
         best_practices_check = await self._check_best_practices()
         for practice in best_practices_check:
             if not practice['implemented']:
-                review.action_items.append({
-                    'action': 'implement',
-                    'target': practice['name'],
-                    'priority': practice.get('priority', 'medium')
-                })
+                review.action_items.append(ActionItem(
+                    'implement',
+                    practice['name'],
+                    priority=practice.get('priority', 'medium')
+                ))
         
         # Phase 4: Performance analysis
         performance_analysis = self._analyze_performance()
         if performance_analysis['issues']:
             for issue in performance_analysis['issues']:
-                review.action_items.append({
-                    'action': 'optimize',
-                    'target': issue['component'],
-                    'metric': issue['metric'],
-                    'current': issue['current'],
-                    'target_value': issue['target']
-                })
+                review.action_items.append(ActionItem(
+                    'optimize',
+                    issue['component'],
+                    metric=issue['metric'],
+                    current=issue['current'],
+                    target_value=issue['target']
+                ))
         
         # Calculate estimated improvement
         review.estimated_improvement = self._calculate_improvement_potential(review)
@@ -295,58 +806,82 @@ class DailyArchitectureReviewer:
         self.review_schedule['last_review'] = datetime.now()
         
         # Generate summary
-        self.logger.info(f"✅ Review complete:")
-        self.logger.info(f"   Components reviewed: {len(review.components_reviewed)}")
-        self.logger.info(f"   Improvements found: {len(review.improvements_found)}")
-        self.logger.info(f"   Tools to replace: {len(review.tools_to_replace)}")
-        self.logger.info(f"   Estimated improvement: {review.estimated_improvement:.1f}%")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("✅ Review complete:")
+            self.logger.info("   Components reviewed: %s", len(review.components_reviewed))
+            self.logger.info("   Improvements found: %s", len(review.improvements_found))
+            self.logger.info("   Tools to replace: %s", len(review.tools_to_replace))
+            self.logger.info("   Estimated improvement: %.1f%%", review.estimated_improvement)
         
         return review
     
-    async def _review_component(self, component: ArchitectureComponent) -> Optional[Dict]:
+    async def _review_component(self, component: ArchitectureComponent) -> Optional[Improvement]:
         """Review a single architecture component"""
         
-        improvement = {
-            'component': component.name,
-            'current_tool': component.current_tool,
-            'issues': [],
-            'alternatives_evaluated': []
-        }
+        current_eval = await self._evaluate_tool(component.current_tool, component.category)
+        
+        # No alternative can clear the margin over a top-scoring tool
+        if current_eval.score * self.better_tool_margin >= 1.0:
+            alternatives = []
+        else:
+            alternatives = [alt for alt in component.alternatives if self._worth_evaluating(alt['name'])]
         
-        # Evaluate current tool
-        current_eval = await self._evaluate_tool(
-            component.current_tool,
-            component.category
+        alt_evals = await asyncio.gather(
+            *(self._evaluate_tool(alt['name'], component.category) for alt in alternatives)
         )
         
-        # Research alternatives
-        for alt in component.alternatives:
-            alt_eval = await self._evaluate_tool(
-                alt['name'],
-                component.category
-            )
-            
-            improvement['alternatives_evaluated'].append({
-                'name': alt['name'],
-                'score': alt_eval.score,
-                'better': alt_eval.is_better_than(current_eval)
-            })
+        evaluated = []
+        best = None
+        for alt, alt_eval in zip(alternatives, alt_evals):
+            better = alt_eval.is_better_than(current_eval, self.better_tool_margin)
+            evaluated.append(AlternativeScore(alt['name'], alt_eval.score, better))
             
             # If significantly better, recommend replacement
-            if alt_eval.is_better_than(current_eval):
-                improvement['replacement'] = alt['name']
-                improvement['improvement_score'] = alt_eval.score - current_eval.score
-                improvement['reasons'] = alt_eval.pros[:3]
+            if better:
+                best = alt_eval
         
         # Update component
-        component.last_reviewed = datetime.now()
+        component.last_reviewed_ts = time.time()
         component.performance_score = current_eval.score
-        
-        return improvement if improvement.get('replacement') or improvement['issues'] else None
+        self._components_version += 1
+        
+        if best is None:
+            return None
+        return Improvement(
+            component=component.name,
+            current_tool=component.current_tool,
+            alternatives_evaluated=tuple(evaluated),
+            replacement=best.name,
+            improvement_score=best.score - current_eval.score,
+            reasons=tuple(best.pros[:3])
+        )
+    
+    def _worth_evaluating(self, tool_name: str) -> bool:
+        """Cheap pre-filter of alternatives using the known tool data"""
+        known = _KNOWN_TOOLS.get(tool_name)
+        if known is None:
+            return True
+        return (known['github_stars'] >= self.min_alternative_stars
+                and (self.max_alternative_age is None
+                     or known['last_commit_age'] <= self.max_alternative_age))
     
     async def _evaluate_tool(self, tool_name: str, category: str) -> ToolEvaluation:
         """Evaluate a tool comprehensively"""
         
+        # Fetch tool information (would use real APIs in production)
+        tool_info = await self._fetch_tool_info(tool_name)
+        return self._score_tool(tool_name, category, tool_info)
+    
+    def _evaluate_tool_now(self, tool_name: str, category: str) -> Optional[ToolEvaluation]:
+        """Evaluate a tool without I/O, or None when its info needs a lookup"""
+        tool_info = self._tool_info_now(tool_name)
+        if tool_info is None:
+            return None
+        return self._score_tool(tool_name, category, tool_info)
+    
+    def _score_tool(self, tool_name: str, category: str, tool_info: Dict[str, Any]) -> ToolEvaluation:
+        """Score a tool from its info"""
+        
         evaluation = ToolEvaluation(
             name=tool_name,
             version='latest',
@@ -356,9 +891,6 @@ class DailyArchitectureReviewer:
             score=0.5  # Base score
         )
         
-        # Fetch tool information (would use real APIs in production)
-        tool_info = await self._fetch_tool_info(tool_name)
-        
         # Evaluate based on multiple criteria
         
         # 1. Popularity and community
@@ -370,9 +902,9 @@ class DailyArchitectureReviewer:
             evaluation.score += 0.1
         
         # 2. Maintenance
-        last_commit = tool_info.get('last_commit')
-        if last_commit:
-            days_since = (datetime.now() - last_commit).days
+        last_commit_ts = tool_info.get('last_commit_ts')
+        if last_commit_ts:
+            days_since = (time.time() - last_commit_ts) / DAY_SECONDS
             if days_since < 7:
                 evaluation.pros.append('Actively maintained')
                 evaluation.score += 0.15
@@ -393,7 +925,7 @@ class DailyArchitectureReviewer:
         
         # 4. Performance (category-specific)
         if category in ['web_backend', 'database']:
-            if 'fast' in tool_name.lower() or 'performance' in str(tool_info):
+            if _FAST_RE.search(tool_name) or 'performance' in str(tool_info):
                 evaluation.pros.append('High performance')
                 evaluation.score += 0.15
         
@@ -406,7 +938,7 @@ class DailyArchitectureReviewer:
             evaluation.score -= 0.1
         
         # 6. Existing solution vs custom (core principle)
-        if 'framework' in tool_name.lower() or 'platform' in tool_name.lower():
+        if _SOLUTION_RE.search(tool_name):
             evaluation.pros.append('Complete solution (minimal custom code)')
             evaluation.score += 0.2
         
@@ -420,6 +952,287 @@ class DailyArchitectureReviewer:
         
         return evaluation
     
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Shared HTTP session, so lookups reuse pooled keep-alive connections"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=50,
+                    limit_per_host=10,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _load_tool_cache(self):
+        """Open the tool info cache and load its fresh, current-version rows"""
+        self.tool_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.tool_cache_path), check_same_thread=False)
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS tool_info '
+            '(key TEXT PRIMARY KEY, version INTEGER, fetched_at REAL, payload TEXT)'
+        )
+        conn.execute('DELETE FROM tool_info WHERE version != ?', (TOOL_INFO_CACHE_VERSION,))
+        conn.commit()
+        
+        cache = {}
+        cutoff = time.time() - TOOL_INFO_CACHE_TTL
+        for key, fetched_at, payload in conn.execute(
+            'SELECT key, fetched_at, payload FROM tool_info WHERE fetched_at > ?', (cutoff,)
+        ):
+            cache[key] = (fetched_at, json.loads(payload))
+        
+        self._tool_cache_conn = conn
+        self._tool_cache = cache
+    
+    def _save_tool_info(self, rows: List[Tuple[str, float, Dict[str, Any]]]):
+        """Write lookup results through to the on-disk cache"""
+        with self._tool_cache_lock:
+            self._tool_cache_conn.executemany(
+                'INSERT OR REPLACE INTO tool_info VALUES (?, ?, ?, ?)',
+                [(key, TOOL_INFO_CACHE_VERSION, fetched_at, json.dumps(info))
+                 for key, fetched_at, info in rows]
+            )
+            self._tool_cache_conn.commit()
+    
+    async def _ensure_tool_cache(self):
+        """Load the on-disk tool cache once, off the event loop"""
+        if self._tool_cache is None:
+            if self._tool_cache_loading is None:
+                self._tool_cache_loading = asyncio.Lock()
+            async with self._tool_cache_loading:
+                if self._tool_cache is None:
+                    await asyncio.get_running_loop().run_in_executor(None, self._load_tool_cache)
+    
+    async def _store_tool_info(self, infos: Dict[str, Dict[str, Any]]):
+        """Add fresh lookups to the in-memory and on-disk caches"""
+        fetched_at = time.time()
+        rows = []
+        for repository, info in infos.items():
+            self._tool_cache[repository] = (fetched_at, info)
+            rows.append((repository, fetched_at, info))
+        if rows:
+            await asyncio.get_running_loop().run_in_executor(None, self._save_tool_info, rows)
+    
+    def _cached_github_info(self, repository: str) -> Optional[Dict[str, Any]]:
+        """Fresh cached info for a repository, if any"""
+        cached = self._tool_cache.get(repository)
+        if cached and time.time() - cached[0] < TOOL_INFO_CACHE_TTL:
+            return dict(cached[1])
+        return None
+    
+    async def _prefetch_github_info(self):
+        """Fetch every uncached tool repository through batched GraphQL queries"""
+        # GitHub's GraphQL API only accepts authenticated requests
+        if not os.getenv('GITHUB_TOKEN'):
+            return
+        await self._ensure_tool_cache()
+        
+        names = set()
+        for component in self.components.values():
+            names.add(component.current_tool)
+            names.update(alt['name'] for alt in component.alternatives)
+        repositories = sorted({
+            self.tool_repositories[name] for name in names if name in self.tool_repositories
+        })
+        missing = [repo for repo in repositories if self._cached_github_info(repo) is None]
+        
+        batches = [missing[i:i + GRAPHQL_BATCH_SIZE] for i in range(0, len(missing), GRAPHQL_BATCH_SIZE)]
+        results = await asyncio.gather(*(self._request_github_info_batch(batch) for batch in batches))
+        for infos in results:
+            await self._store_tool_info(infos)
+    
+    async def _request_github_info_batch(self, repositories: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Request stars and last push for many repositories in one GraphQL query"""
+        fields = []
+        for i, repository in enumerate(repositories):
+            owner, name = repository.split('/', 1)
+            fields.append(
+                f'r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) '
+                '{ stargazerCount pushedAt }'
+            )
+        data = await self._fetch_json(
+            'https://api.github.com/graphql',
+            self._github_headers(),
+            payload={'query': 'query { ' + ' '.join(fields) + ' }'}
+        )
+        if not data or not data.get('data'):
+            return {}
+        
+        infos = {}
+        for i, repository in enumerate(repositories):
+            repo = data['data'].get(f'r{i}')
+            # Renamed or deleted repositories come back as null
+            if repo and repo.get('pushedAt'):
+                infos[repository] = self._github_info(repo['stargazerCount'], repo['pushedAt'])
+        return infos
+    
+    async def _fetch_github_info(self, repository: str) -> Optional[Dict[str, Any]]:
+        """Fetch stars and last push for a GitHub repository, cached for a few hours"""
+        await self._ensure_tool_cache()
+        
+        cached = self._cached_github_info(repository)
+        if cached is not None:
+            return cached
+        
+        info = await self._request_github_info(repository)
+        if info is not None:
+            await self._store_tool_info({repository: info})
+        return info
+    
+    @contextlib.asynccontextmanager
+    async def _open_url(self, url: str, headers: Optional[Dict[str, str]] = None,
+                        payload: Optional[Any] = None):
+        """GET a response (POST when a JSON payload is given), bounded by the
+        concurrency and per-host rate limits"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        host = urlparse(url).netloc
+        limiter = self._rate_limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(*self.rate_limits.get(host, self.default_rate_limit))
+            self._rate_limiters[host] = limiter
+        
+        session = await self._ensure_session()
+        async with self._semaphore:
+            await limiter.acquire()
+            method = 'GET' if payload is None else 'POST'
+            async with session.request(method, url, headers=headers, json=payload) as response:
+                yield response
+    
+    async def _fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None,
+                          payload: Optional[Any] = None) -> Optional[Any]:
+        """Fetch a JSON document"""
+        try:
+            async with self._open_url(url, headers, payload) as response:
+                if response.status != 200:
+                    self.logger.debug("%s returned %s", url, response.status)
+                    return None
+                return await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.debug("%s failed: %s", url, e)
+            return None
+    
+    async def _stream_feed_items(self, url: str) -> List[Dict[str, str]]:
+        """Titles and links of an RSS/Atom feed, parsed incrementally as it downloads"""
+        items: List[Dict[str, str]] = []
+        parser = ElementTree.XMLPullParser(events=('end',))
+        try:
+            async with self._open_url(url) as response:
+                if response.status != 200:
+                    self.logger.debug("GET %s returned %s", url, response.status)
+                    return items
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    parser.feed(chunk)
+                    self._collect_feed_items(parser, items)
+            parser.close()
+            self._collect_feed_items(parser, items)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ElementTree.ParseError) as e:
+            self.logger.debug("Feed %s failed: %s", url, e)
+        return items
+    
+    @staticmethod
+    def _collect_feed_items(parser: ElementTree.XMLPullParser, items: List[Dict[str, str]]):
+        """Move completed <item>/<entry> elements out of the parser"""
+        for _, elem in parser.read_events():
+            tag = elem.tag.rsplit('}', 1)[-1]
+            if tag not in ('item', 'entry'):
+                continue
+            
+            title, link = '', ''
+            for child in elem:
+                child_tag = child.tag.rsplit('}', 1)[-1]
+                if child_tag == 'title':
+                    title = (child.text or '').strip()
+                elif child_tag == 'link':
+                    link = (child.text or child.get('href') or '').strip()
+            items.append({'title': title, 'url': link})
+            
+            # Entries are consumed as they arrive, so memory stays O(entry)
+            elem.clear()
+    
+    async def _scrape_github_trending(self) -> List[Dict[str, str]]:
+        """Repository names and links from the GitHub trending page"""
+        url = self.research_sources['github_trending']
+        try:
+            async with self._open_url(url) as response:
+                if response.status != 200:
+                    self.logger.debug("GET %s returned %s", url, response.status)
+                    return []
+                html = await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.debug("GET %s failed: %s", url, e)
+            return []
+        
+        if SELECTOLAX_AVAILABLE:
+            hrefs = [node.attributes.get('href') for node in HTMLParser(html).css('article.Box-row h2 a')]
+        else:
+            hrefs = [a.get('href') for a in BeautifulSoup(html, 'html.parser').select('article.Box-row h2 a')]
+        
+        return [
+            {'title': href.strip('/').split('/')[-1], 'url': urljoin(url, href)}
+            for href in hrefs if href
+        ]
+    
+    def _categorize(self, text: str) -> Optional[str]:
+        """Tool category a research item's text refers to, if any"""
+        text = text.lower()
+        for category, config in self.tool_preferences.items():
+            keywords = [category.replace('_', ' '), config['current'], *config['alternatives']]
+            if any(keyword.lower() in text for keyword in keywords):
+                return category
+        return None
+    
+    async def _research_live_sources(self) -> List[Dict[str, Any]]:
+        """Discoveries from the research feeds and GitHub trending"""
+        results = await asyncio.gather(
+            *(self._stream_feed_items(url) for url in self.research_feeds.values()),
+            self._scrape_github_trending()
+        )
+        
+        discoveries = []
+        for items in results:
+            for item in items:
+                category = self._categorize(item['title'])
+                if category:
+                    discoveries.append({
+                        'name': item['title'],
+                        'category': category,
+                        'reason': item['title'],
+                        'url': item['url']
+                    })
+        return discoveries
+    
+    async def _request_github_info(self, repository: str) -> Optional[Dict[str, Any]]:
+        """Request stars and last push for a GitHub repository"""
+        data = await self._fetch_json(f'https://api.github.com/repos/{repository}', self._github_headers())
+        if not data:
+            return None
+        return self._github_info(data.get('stargazers_count', 0), data['pushed_at'])
+    
+    @staticmethod
+    def _github_headers() -> Dict[str, str]:
+        """Headers for GitHub API requests, authenticated when a token is set"""
+        headers = {'Accept': 'application/vnd.github+json'}
+        token = os.getenv('GITHUB_TOKEN')
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        return headers
+    
+    @staticmethod
+    def _github_info(stars: int, pushed_at: str) -> Dict[str, Any]:
+        """Tool info from a repository's star count and ISO push time"""
+        pushed = datetime.fromisoformat(pushed_at.replace('Z', '+00:00'))
+        return {'github_stars': stars, 'last_commit_ts': pushed.timestamp()}
+    
     async def _fetch_tool_info(self, tool_name: str) -> Dict[str, Any]:
         """Fetch information about a tool"""
         
@@ -429,68 +1242,49 @@ class DailyArchitectureReviewer:
         # 3. Scrape documentation sites
         # 4. Check Stack Overflow for questions/answers
         
-        # For now, return mock data based on known tools
-        known_tools = {
-            'FastAPI': {
-                'github_stars': 65000,
-                'last_commit': datetime.now() - timedelta(days=1),
-                'documentation_quality': 'excellent',
-                'learning_curve': 'moderate',
-                'integrations': 50
-            },
-            'Next.js': {
-                'github_stars': 115000,
-                'last_commit': datetime.now() - timedelta(hours=6),
-                'documentation_quality': 'excellent',
-                'learning_curve': 'moderate',
-                'integrations': 100
-            },
-            'Supabase': {
-                'github_stars': 60000,
-                'last_commit': datetime.now() - timedelta(hours=12),
-                'documentation_quality': 'good',
-                'learning_curve': 'easy',
-                'integrations': 30
-            },
-            'Vercel': {
-                'github_stars': 12000,
-                'last_commit': datetime.now() - timedelta(days=2),
-                'documentation_quality': 'excellent',
-                'learning_curve': 'easy',
-                'integrations': 50
-            },
-            'Railway': {
-                'github_stars': 3000,
-                'last_commit': datetime.now() - timedelta(days=3),
-                'documentation_quality': 'good',
-                'learning_curve': 'easy',
-                'integrations': 25
-            },
-            'Clerk': {
-                'github_stars': 5000,
-                'last_commit': datetime.now() - timedelta(days=1),
-                'documentation_quality': 'excellent',
-                'learning_curve': 'easy',
-                'integrations': 20
-            }
-        }
-        
-        # Return known data or defaults
-        return known_tools.get(tool_name, {
-            'github_stars': 1000,
-            'last_commit': datetime.now() - timedelta(days=30),
-            'documentation_quality': 'unknown',
-            'learning_curve': 'moderate',
-            'integrations': 5
-        })
+        info = self._tool_info_now(tool_name)
+        if info is None:
+            live_info = await self._fetch_github_info(self.tool_repositories[tool_name])
+            info = self._merge_tool_info(tool_name, live_info)
+        return info
+    
+    def _tool_info_now(self, tool_name: str) -> Optional[Dict[str, Any]]:
+        """Tool info if available without I/O, else None"""
+        
+        # Live GitHub data overrides the known stars/last commit when enabled
+        live_info = None
+        repository = self.tool_repositories.get(tool_name)
+        if self.live_research and repository:
+            if self._tool_cache is None:
+                return None
+            live_info = self._cached_github_info(repository)
+            if live_info is None:
+                return None
+        return self._merge_tool_info(tool_name, live_info)
+    
+    @staticmethod
+    def _merge_tool_info(tool_name: str, live_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Known (or default) tool data with any live data on top"""
+        
+        # Otherwise return mock data based on known tools or defaults
+        known = _KNOWN_TOOLS.get(tool_name, _DEFAULT_TOOL_INFO)
+        info = {key: value for key, value in known.items() if key != 'last_commit_age'}
+        info['last_commit_ts'] = time.time() - known['last_commit_age'].total_seconds()
+        if live_info:
+            info = {**info, **live_info}
+        return info
     
     async def _research_new_tools(self) -> List[Dict[str, Any]]:
         """Research new tools and technologies"""
         
         discoveries = []
         
-        # Would actually scrape these sources in production
-        # For now, simulate discoveries
+        # Live research streams the feeds and trending page; otherwise
+        # simulate discoveries
+        if self.live_research:
+            discoveries = await self._research_live_sources()
+            self.logger.info("🔬 Discovered %s new tools to evaluate", len(discoveries))
+            return discoveries
         
         trending_tools = [
             {'name': 'Bun', 'category': 'runtime', 'reason': 'Faster than Node.js'},
@@ -505,23 +1299,24 @@ class DailyArchitectureReviewer:
             if tool['category'] in self.tool_preferences:
                 discoveries.append(tool)
         
-        self.logger.info(f"🔬 Discovered {len(discoveries)} new tools to evaluate")
+        self.logger.info("🔬 Discovered %s new tools to evaluate", len(discoveries))
         
         return discoveries
     
     def _should_adopt(self, discovery: Dict[str, Any]) -> bool:
         """Determine if a new tool should be adopted"""
         
-        # Criteria for adoption
-        criteria = {
-            'matches_need': discovery.get('category') in self.tool_preferences,
-            'mature_enough': True,  # Would check actual metrics
-            'better_than_current': discovery.get('reason', '').lower().count('better') > 0,
-            'minimal_custom_code': 'framework' in discovery.get('name', '').lower()
-        }
+        # Criteria for adoption: matches a need, mature enough (would check
+        # actual metrics), better than current, minimal custom code
+        criteria_met = (
+            (discovery.get('category') in self.tool_preferences)
+            + True
+            + (_BETTER_RE.search(discovery.get('reason', '')) is not None)
+            + (_FRAMEWORK_RE.search(discovery.get('name', '')) is not None)
+        )
         
         # Need at least 3 criteria met
-        return sum(criteria.values()) >= 3
+        return criteria_met >= 3
     
     async def _check_best_practices(self) -> List[Dict[str, Any]]:
         """Check implementation of best practices"""
@@ -551,11 +1346,12 @@ class DailyArchitectureReviewer:
         
         return practices_check
     
+    @_versioned_cache('_components_version')
     def _is_principle_implemented(self, principle: str) -> bool:
         """Check if a principle is implemented"""
         
         # Simple checks for now
-        if 'custom coding' in principle.lower():
+        if _CUSTOM_RE.search(principle):
             # Check if we're using mostly existing tools
             custom_ratio = self._calculate_custom_code_ratio()
             return custom_ratio < 0.2  # Less than 20% custom code
@@ -563,6 +1359,7 @@ class DailyArchitectureReviewer:
         # Default to True for other principles
         return True
     
+    @_versioned_cache('_components_version')
     def _calculate_custom_code_ratio(self) -> float:
         """Calculate ratio of custom code vs using tools"""
         
@@ -579,6 +1376,12 @@ class DailyArchitectureReviewer:
         total = using_tools + custom
         return custom / total if total > 0 else 0
     
+    @_versioned_cache('_components_version')
+    def _component_categories(self) -> frozenset:
+        """Set of component categories"""
+        return frozenset(c.category for c in self.components.values())
+    
+    @_versioned_cache('_components_version')
     def _is_pattern_applicable(self, pattern: str) -> bool:
         """Check if a pattern is applicable to current architecture"""
         
@@ -587,7 +1390,7 @@ class DailyArchitectureReviewer:
             'microservices': len(self.components) > 5,
             'serverless': 'deployment' in self.components,
             'event-driven': 'messaging' in self.components or 'queue' in self.components,
-            'api-first': 'api' in [c.category for c in self.components.values()],
+            'api-first': 'api' in self._component_categories(),
             'cloud-native': True,  # Always applicable
             'jamstack': 'web_frontend' in self.components,
             'composable': True,  # Always good
@@ -603,14 +1406,23 @@ class DailyArchitectureReviewer:
         if pattern == 'microservices':
             return len(self.components) > 5 and 'api' in self.components
         elif pattern == 'serverless':
-            return any('vercel' in c.current_tool.lower() or 'lambda' in c.current_tool.lower() 
-                      for c in self.components.values())
+            return any(_SERVERLESS_RE.search(c.current_tool) for c in self.components.values())
         elif pattern == 'cloud-native':
-            return any('cloud' in c.current_tool.lower() or 'vercel' in c.current_tool.lower() 
-                      for c in self.components.values())
+            return any(_CLOUD_RE.search(c.current_tool) for c in self.components.values())
         
         return False
     
+    def _component_scores(self) -> Tuple[List[str], np.ndarray]:
+        """Component names and their performance scores as one array"""
+        if self._score_cache is None or self._score_cache[0] != self._components_version:
+            names = list(self.components)
+            scores = np.fromiter(
+                (self.components[name].performance_score for name in names),
+                dtype=np.float64, count=len(names)
+            )
+            self._score_cache = (self._components_version, names, scores)
+        return self._score_cache[1], self._score_cache[2]
+    
     def _analyze_performance(self) -> Dict[str, Any]:
         """Analyze performance of current architecture"""
         
@@ -621,21 +1433,18 @@ class DailyArchitectureReviewer:
         }
         
         # Check each component's performance
-        total_score = 0
-        for component in self.components.values():
-            total_score += component.performance_score
-            
-            if component.performance_score < 0.7:
-                analysis['issues'].append({
-                    'component': component.name,
-                    'metric': 'performance_score',
-                    'current': component.performance_score,
-                    'target': 0.8
-                })
+        names, scores = self._component_scores()
+        for i in np.flatnonzero(scores < 0.7):
+            analysis['issues'].append({
+                'component': self.components[names[i]].name,
+                'metric': 'performance_score',
+                'current': float(scores[i]),
+                'target': 0.8
+            })
         
         # Calculate overall score
-        if self.components:
-            analysis['overall_score'] = total_score / len(self.components)
+        if len(scores):
+            analysis['overall_score'] = float(scores.mean())
         
         # Generate recommendations
         if analysis['overall_score'] < 0.8:
@@ -682,30 +1491,29 @@ class DailyArchitectureReviewer:
         # Replace tools
         for component_name, new_tool in review.tools_to_replace.items():
             try:
-                self.logger.info(f"  Replacing {component_name} with {new_tool}")
+                self.logger.info("  Replacing %s with %s", component_name, new_tool)
                 
                 # Update component
                 if component_name in self.components:
                     old_tool = self.components[component_name].current_tool
                     self.components[component_name].current_tool = new_tool
+                    self._components_version += 1
                     
                     # Update tool preferences
                     if component_name in self.tool_preferences:
                         self.tool_preferences[component_name]['current'] = new_tool
                     
-                    implementation_results['tools_replaced'].append({
-                        'component': component_name,
-                        'old': old_tool,
-                        'new': new_tool
-                    })
+                    implementation_results['tools_replaced'].append(
+                        ToolReplacement(component_name, old_tool, new_tool)
+                    )
                     
             except Exception as e:
-                self.logger.error(f"  Failed to replace {component_name}: {e}")
+                self.logger.error("  Failed to replace %s: %s", component_name, e)
         
         # Adopt patterns
         for pattern in review.patterns_to_adopt:
             try:
-                self.logger.info(f"  Adopting pattern: {pattern}")
+                self.logger.info("  Adopting pattern: %s", pattern)
                 
                 # Add to best practices
                 if pattern not in self.best_practices['patterns']:
@@ -714,18 +1522,18 @@ class DailyArchitectureReviewer:
                 implementation_results['patterns_adopted'].append(pattern)
                 
             except Exception as e:
-                self.logger.error(f"  Failed to adopt {pattern}: {e}")
+                self.logger.error("  Failed to adopt %s: %s", pattern, e)
         
         # Execute action items
         for action in review.action_items[:5]:  # Limit to 5 per review
             try:
-                self.logger.info(f"  Executing: {action['action']} on {action['target']}")
+                self.logger.info("  Executing: %s on %s", action.action, action.target)
                 
                 # Simulate action execution
                 implementation_results['actions_completed'].append(action)
                 
             except Exception as e:
-                self.logger.error(f"  Failed action: {e}")
+                self.logger.error("  Failed action: %s", e)
         
         # Calculate success rate
         total_items = (len(review.tools_to_replace) + 
@@ -739,7 +1547,7 @@ class DailyArchitectureReviewer:
         if total_items > 0:
             implementation_results['success_rate'] = completed_items / total_items
         
-        self.logger.info(f"✅ Implementation complete: {implementation_results['success_rate']:.1%} success rate")
+        self.logger.info("✅ Implementation complete: %.1f%% success rate", implementation_results['success_rate'] * 100)
         
         return implementation_results
     
@@ -756,18 +1564,17 @@ class DailyArchitectureReviewer:
         }
         
         # Component status
-        total_score = 0
         for name, component in self.components.items():
             status['components'][name] = {
                 'tool': component.current_tool,
                 'score': component.performance_score,
                 'needs_review': component.needs_review()
             }
-            total_score += component.performance_score
         
         # Overall health
-        if self.components:
-            status['overall_health'] = total_score / len(self.components)
+        _, scores = self._component_scores()
+        if len(scores):
+            status['overall_health'] = float(scores.mean())
         
         # Check best practices
         if status['custom_code_ratio'] > 0.3:
@@ -785,31 +1592,67 @@ class DailyArchitectureReviewer:
         
         return status
     
+    def get_architecture_status_json(self) -> bytes:
+        """Get current architecture status as cached JSON bytes"""
+        
+        key = (self._components_version, self.review_schedule['last_review'])
+        now = time.monotonic()
+        # needs_review() ages with the clock, so the snapshot also expires
+        if (self._status_cache is None or self._status_cache[0] != key
+                or now - self._status_cache[1] > STATUS_SNAPSHOT_TTL):
+            status = self.get_architecture_status()
+            self._status_cache = (key, now, json_dumps(status))
+        return self._status_cache[2]
+    
     async def research_specific_need(self, need: str) -> Dict[str, Any]:
         """
         Research tools for a specific need.
         
         This implements the principle: always find existing tools first.
+        Results are cached per normalized need.
         """
         
-        self.logger.info(f"🔍 Researching tools for: {need}")
+        # Deep copy: callers may edit the nested lists of the cached result
+        research_result = copy.deepcopy(await self._research_need(need.lower().strip()))
+        research_result['need'] = need
+        return research_result
+    
+    # Mock and live tool data give different evaluations, so results are
+    # kept apart when live research is toggled
+    @_async_lfu_cache(RESEARCH_CACHE_SIZE, RESEARCH_CACHE_TTL,
+                     key=lambda self, need: (need, self.live_research))
+    async def _research_need(self, need: str) -> Dict[str, Any]:
+        """Research tools for a normalized need"""
+        
+        self.logger.info("🔍 Researching tools for: %s", need)
         
-        research_result = {
-            'need': need,
-            'recommended_tools': [],
-            'build_vs_buy': 'buy',  # Default to using existing tools
-            'reasoning': []
-        }
+        research_result = _EMPTY_RESEARCH.copy()
+        research_result['need'] = need
+        research_result['recommended_tools'] = []
+        research_result['reasoning'] = []
         
         # Search for existing tools
         existing_tools = await self._search_existing_tools(need)
         
         if existing_tools:
-            # Evaluate each tool
-            for tool in existing_tools[:5]:  # Top 5
-                evaluation = await self._evaluate_tool(tool['name'], need)
-                
+            # Evaluate the top 5 tools concurrently
+            candidates = existing_tools[:5]
+            evaluations = [self._evaluate_tool_now(tool['name'], need) for tool in candidates]
+            
+            # Only tools whose info needs a lookup go through the event loop
+            misses = [i for i, evaluation in enumerate(evaluations) if evaluation is None]
+            if misses:
+                fetched = await asyncio.gather(
+                    *(self._evaluate_tool(candidates[i]['name'], need) for i in misses)
+                )
+                for i, evaluation in zip(misses, fetched):
+                    evaluations[i] = evaluation
+            
+            best_name, best_score = None, -1.0
+            for tool, evaluation in zip(candidates, evaluations):
                 if evaluation.score > 0.7:
+                    if evaluation.score > best_score:
+                        best_name, best_score = tool['name'], evaluation.score
                     research_result['recommended_tools'].append({
                         'name': tool['name'],
                         'score': evaluation.score,
@@ -817,11 +1660,10 @@ class DailyArchitectureReviewer:
                         'url': tool.get('url', '')
                     })
             
-            if research_result['recommended_tools']:
+            if best_name is not None:
                 research_result['reasoning'].append('Found excellent existing tools')
                 research_result['reasoning'].append('No need for custom development')
-                best_tool = max(research_result['recommended_tools'], key=lambda x: x['score'])
-                research_result['recommendation'] = f"Use {best_tool['name']}"
+                research_result['recommendation'] = f"Use {best_name}"
             else:
                 # No good tools found, might need custom
                 research_result['build_vs_buy'] = 'build_minimal'
@@ -836,7 +1678,7 @@ class DailyArchitectureReviewer:
         
         return research_result
     
-    async def _search_existing_tools(self, need: str) -> List[Dict[str, Any]]:
+    async def _search_existing_tools(self, need: str) -> Sequence[Mapping[str, str]]:
         """Search for existing tools that meet the need"""
         
         # In production, this would search:
@@ -845,59 +1687,31 @@ class DailyArchitectureReviewer:
         # - Product Hunt
         # - Google
         
-        # For now, use knowledge base
-        tool_database = {
-            'authentication': [
-                {'name': 'Clerk', 'url': 'https://clerk.dev'},
-                {'name': 'Auth0', 'url': 'https://auth0.com'},
-                {'name': 'Supabase Auth', 'url': 'https://supabase.com'},
-                {'name': 'Firebase Auth', 'url': 'https://firebase.google.com'},
-                {'name': 'Lucia', 'url': 'https://lucia-auth.com'}
-            ],
-            'database': [
-                {'name': 'Supabase', 'url': 'https://supabase.com'},
-                {'name': 'PlanetScale', 'url': 'https://planetscale.com'},
-                {'name': 'Neon', 'url': 'https://neon.tech'},
-                {'name': 'Railway', 'url': 'https://railway.app'},
-                {'name': 'Turso', 'url': 'https://turso.tech'}
-            ],
-            'deployment': [
-                {'name': 'Vercel', 'url': 'https://vercel.com'},
-                {'name': 'Netlify', 'url': 'https://netlify.com'},
-                {'name': 'Railway', 'url': 'https://railway.app'},
-                {'name': 'Fly.io', 'url': 'https://fly.io'},
-                {'name': 'Render', 'url': 'https://render.com'}
-            ],
-            'payment': [
-                {'name': 'Stripe', 'url': 'https://stripe.com'},
-                {'name': 'Lemonsqueezy', 'url': 'https://lemonsqueezy.com'},
-                {'name': 'Paddle', 'url': 'https://paddle.com'},
-                {'name': 'PayPal', 'url': 'https://paypal.com'}
-            ],
-            'email': [
-                {'name': 'Resend', 'url': 'https://resend.com'},
-                {'name': 'SendGrid', 'url': 'https://sendgrid.com'},
-                {'name': 'Postmark', 'url': 'https://postmarkapp.com'},
-                {'name': 'AWS SES', 'url': 'https://aws.amazon.com/ses'}
-            ]
-        }
-        
-        # Find matching category
+        # For now, use the knowledge base; find matching category
         need_lower = need.lower()
-        for category, tools in tool_database.items():
-            if category in need_lower or any(word in need_lower for word in category.split('_')):
+        for category, words, tools in _CATEGORY_MATCH:
+            if category in need_lower:
                 return tools
+            for word in words:
+                if word in need_lower:
+                    return tools
         
         # Search by keywords
-        keywords = need_lower.split()
-        matching_tools = []
+        positions = set()
+        for keyword in need_lower.split():
+            positions.update(_NAME_INDEX.get(keyword, ()))
         
-        for category, tools in tool_database.items():
-            for tool in tools:
-                if any(keyword in tool['name'].lower() for keyword in keywords):
-                    matching_tools.append(tool)
-        
-        return matching_tools
+        return [_ALL_TOOLS[position] for position in sorted(positions)]
+
+
+def _next_run_ts(at: daytime, after: float) -> float:
+    """Epoch time of the first daily run at `at` (local time) after `after`"""
+    day = datetime.fromtimestamp(after).date()
+    run_ts = datetime.combine(day, at).timestamp()
+    if run_ts <= after:
+        # Combining with the next date keeps the local time across DST changes
+        run_ts = datetime.combine(day + timedelta(days=1), at).timestamp()
+    return run_ts
 
 
 # Integration function for OSA
@@ -911,19 +1725,15 @@ async def enhance_osa_with_architecture_review(osa_instance):
     
     # Schedule daily review
     async def daily_review_task():
+        # Wait until review time (2 AM)
+        next_ts = _next_run_ts(reviewer.review_schedule['daily'], time.time())
         while True:
-            # Wait until review time (2 AM)
-            now = datetime.now()
-            review_time = datetime.combine(now.date(), reviewer.review_schedule['daily'])
-            
-            if now > review_time:
-                # Next day
-                review_time += timedelta(days=1)
-            
-            wait_seconds = (review_time - now).total_seconds()
-            
-            # Wait until review time
-            await asyncio.sleep(wait_seconds)
+            # asyncio sleeps on the monotonic clock; re-check the wall clock
+            # afterwards in case the host was suspended or its clock moved
+            delay = next_ts - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
             
             # Perform review
             review = await reviewer.perform_daily_review()
@@ -931,8 +1741,13 @@ async def enhance_osa_with_architecture_review(osa_instance):
             # Implement improvements
             await reviewer.implement_improvements(review)
             
+            # Release pooled connections until the next review
+            await reviewer.aclose()
+            
             # Log results
-            logging.info(f"Daily architecture review completed: {review.estimated_improvement:.1f}% improvement potential")
+            logging.info("Daily architecture review completed: %.1f%% improvement potential", review.estimated_improvement)
+            
+            next_ts = _next_run_ts(reviewer.review_schedule['daily'], time.time())
     
     # Start daily review task
     asyncio.create_task(daily_review_task())
@@ -942,13 +1757,13 @@ async def enhance_osa_with_architecture_review(osa_instance):
     
     async def enhanced_accomplish(goal: str) -> Dict[str, Any]:
         # First, research if we need any new tools
-        needs = extract_needs_from_goal(goal)
+        # Each distinct need is researched once, concurrently
+        needs = list(dict.fromkeys(extract_needs_from_goal(goal)))
+        researches = await asyncio.gather(*(reviewer.research_specific_need(need) for need in needs))
         
-        for need in needs:
-            research = await reviewer.research_specific_need(need)
-            
+        for need, research in zip(needs, researches):
             if research['recommended_tools']:
-                logging.info(f"📚 Found tools for {need}: {research['recommendation']}")
+                logging.info("📚 Found tools for %s: %s", need, research['recommendation'])
         
         # Execute with best tools
         return await original_accomplish(goal)
@@ -959,24 +1774,17 @@ async def enhance_osa_with_architecture_review(osa_instance):
 
 
 def extract_needs_from_goal(goal: str) -> List[str]:
-    """Extract needs from goal description"""
+    """Extract needs from goal description, each at most once, in a stable order"""
     
-    needs = []
     goal_lower = goal.lower()
     
-    # Common needs
-    need_keywords = {
-        'authentication': ['auth', 'login', 'user', 'signin'],
-        'database': ['database', 'data', 'store', 'persist'],
-        'payment': ['payment', 'billing', 'subscription', 'checkout'],
-        'email': ['email', 'mail', 'notification', 'send'],
-        'deployment': ['deploy', 'host', 'launch', 'publish'],
-        'monitoring': ['monitor', 'track', 'analytics', 'metrics'],
-        'testing': ['test', 'quality', 'validation']
-    }
-    
-    for need, keywords in need_keywords.items():
-        if any(keyword in goal_lower for keyword in keywords):
-            needs.append(need)
+    # One pass over the goal finds every keyword
+    found = 0
+    if _NEED_AUTOMATON is not None:
+        for _, bit in _NEED_AUTOMATON.iter(goal_lower):
+            found |= bit
+    else:
+        for match in _NEED_SCAN.finditer(goal_lower):
+            found |= _NEED_BITS[match.lastgroup]
     
-    return needs
\ No newline at end of file
+    return [need for need, bit in _NEED_BITS.items() if found & bit]
\ No newline at end of file
@@ -18,17 +18,96 @@ Core Philosophy:
 
 import asyncio
 import json
-import hashlib
-from typing import Dict, List, Optional, Any, Set, Tuple
+import itertools
+from typing import Dict, FrozenSet, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 import threading
 import queue
 import logging
-from concurrent.futures import ThreadPoolExecutor
 import random
+import re
+import sys
+import time
+
+import numpy as np
+
+# Work item IDs use xxhash when installed
+from .._compat import short_id
+
+# numba is optional, numeric kernels run as plain NumPy without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _start_task(coro) -> asyncio.Task:
+    """Schedule a coroutine, running it eagerly up to its first suspension
+    on Python 3.12+ so passes with nothing to do skip the scheduler"""
+    if sys.version_info >= (3, 12):
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.create_task(coro)
+
+
+def _njit(func):
+    """Compile a numeric kernel with Numba when it is installed"""
+    if NUMBA_AVAILABLE:
+        return njit(cache=True)(func)
+    return func
+
+
+@_njit
+def _chain_confidence_kernel(confidences: np.ndarray, depth: int) -> float:
+    """Average confidence, adjusted for depth - deeper thinking adds confidence"""
+    return min(confidences.mean() + min(depth * 0.05, 0.3), 1.0)
+
+
+# MinHash over thought words, banded for LSH. 32 bands of 2 rows make
+# thoughts at the 0.6 connection threshold candidates with ~99.9999% probability
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 32
+CONNECTION_WINDOW = 100  # Recent thoughts a new thought may connect to
+_minhash_rng = np.random.default_rng(0x05A)
+_MINHASH_A = _minhash_rng.integers(1, 2**63, MINHASH_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+_MINHASH_B = _minhash_rng.integers(0, 2**63, MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+
+def _minhash(tokens: FrozenSet[str]) -> Optional[np.ndarray]:
+    """MinHash signature of a set of words, None if it is empty"""
+    if not tokens:
+        return None
+    hashes = np.fromiter(
+        (hash(token) for token in tokens), dtype=np.int64, count=len(tokens)
+    ).view(np.uint64)
+    
+    # Multiply-shift hashing, wrapping mod 2**64
+    hashed = (hashes[:, None] * _MINHASH_A + _MINHASH_B) >> np.uint64(32)
+    return hashed.min(axis=0)
+
+
+def _lsh_bands(signature: np.ndarray) -> List[tuple]:
+    """Bucket keys for each LSH band of a signature"""
+    return [
+        (i, band.tobytes())
+        for i, band in enumerate(signature.reshape(MINHASH_BANDS, -1))
+    ]
+
+
+BLOCKER_KEYWORDS = (
+    'cannot', 'unable', 'blocked', 'failed', 'error',
+    'missing', 'required', 'depends', 'waiting', 'stuck'
+)
+# One alternation scans a thought once instead of once per keyword
+_BLOCKER_RE = re.compile('|'.join(map(re.escape, BLOCKER_KEYWORDS)), re.IGNORECASE)
+
+
+def _from_ns(timestamp_ns: int) -> datetime:
+    """Local datetime for an epoch timestamp in nanoseconds"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9)
 
 
 class ThoughtType(Enum):
@@ -62,10 +141,18 @@ class Thought:
     child_thoughts: List[str] = field(default_factory=list)
     connections: List[str] = field(default_factory=list)  # Connected thought IDs
     confidence: float = 0.5
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)
     resolved: bool = False
     action_required: bool = False
     priority: int = 5  # 1-10, higher is more important
+    tokens: FrozenSet[str] = field(init=False, repr=False, compare=False)  # Lowercased words
+    
+    def __post_init__(self):
+        self.tokens = frozenset(self.content.lower().split())
+    
+    @property
+    def timestamp(self) -> datetime:
+        return _from_ns(self.timestamp_ns)
     
     def is_blocker(self) -> bool:
         return self.type == ThoughtType.BLOCKER_DETECTION and not self.resolved
@@ -84,7 +171,11 @@ class Context:
     goals: List[str] = field(default_factory=list)
     resources: Dict[str, Any] = field(default_factory=dict)
     status: str = "active"  # active, blocked, completed
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def created_at(self) -> datetime:
+        return _from_ns(self.created_at_ns)
     
     def add_thought(self, thought_id: str):
         self.active_thoughts.add(thought_id)
@@ -118,19 +209,31 @@ class WorkItem:
     status: str = "pending"  # pending, in_progress, completed, blocked
     context_id: str = ""
     dependencies: List[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)
     deadline: Optional[datetime] = None
     priority: int = 5
     result: Optional[Any] = None
+    
+    @property
+    def created_at(self) -> datetime:
+        return _from_ns(self.created_at_ns)
 
 
 class ContinuousThinkingEngine:
     """
     OSA's continuous thinking engine that enables human-like
     deep reasoning, multi-context awareness, and adaptive problem-solving.
+    
+    Must be created inside a running event loop. The engine spawns many
+    short coroutines, so it benefits from uvloop's faster scheduling
+    (OSA_UVLOOP=1 with the osa CLI).
     """
     
     def __init__(self):
+        # Thought, context and chain IDs are only dict keys, so a counter
+        # is enough to keep them unique
+        self._id_counter = itertools.count(1)
+        
         # Thought storage
         self.thoughts: Dict[str, Thought] = {}
         self.contexts: Dict[str, Context] = {}
@@ -140,17 +243,26 @@ class ContinuousThinkingEngine:
         # Active thinking
         self.active_thoughts: deque = deque(maxlen=10000)  # Recent thoughts
         self.thought_connections: defaultdict = defaultdict(set)  # Graph of connections
+        self._csr_dirty = True  # Connections changed since the CSR arrays were built
+        self._csr: Optional[Tuple[Dict[str, int], np.ndarray, np.ndarray]] = None
         self.blocked_paths: Set[str] = set()  # Paths that are blocked
         self.alternative_paths: Dict[str, List[str]] = {}  # Alternative solutions
         
+        # Incremental LSH index over the most recent thoughts
+        self._lsh_buckets: defaultdict = defaultdict(set)  # Band key -> thought IDs
+        self._lsh_window: deque = deque()  # (thought ID, band keys), oldest first
+        self._unindexed_thoughts: deque = deque()  # Created since the last pass
+        self._pending_blockers: deque = deque()  # Blocker thought IDs not yet scanned
+        self._waiting_blockers: Dict[str, Dict[str, None]] = {}  # Context ID -> its unresolved blockers
+        
         # Context management
         self.current_context_stack: List[str] = []  # Stack of active contexts
-        self.context_switches: List[Tuple[str, str, datetime]] = []  # History
+        self.context_switches: List[Tuple[str, str, int]] = []  # History (epoch ns)
         
         # Continuous thinking state
         self.thinking_enabled = True
+        self._work_event = asyncio.Event()  # Set when new thoughts need a pass
         self.background_thoughts: queue.Queue = queue.Queue()
-        self.thought_executor = ThreadPoolExecutor(max_workers=5)
         
         # Leadership & orchestration
         self.delegation_queue: queue.Queue = queue.Queue()
@@ -173,6 +285,7 @@ class ContinuousThinkingEngine:
             'blocker_timeout': 60,  # Seconds before finding alternatives
             'connection_threshold': 0.6,  # Similarity for connecting thoughts
             'delegation_threshold': 5,  # Complexity before delegating
+            'idle_wake_interval': 1.0,  # Seconds between passes with no new thoughts
         }
         
         # Setup logging
@@ -197,10 +310,19 @@ class ContinuousThinkingEngine:
                 # Context maintenance
                 await self._maintain_contexts()
                 
-                await asyncio.sleep(0.1)  # Brief pause
+                # Sleep until a thought is created, with a periodic pass
+                # for queued background thoughts and context upkeep
+                try:
+                    await asyncio.wait_for(
+                        self._work_event.wait(),
+                        timeout=self.thinking_config['idle_wake_interval']
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._work_event.clear()
         
         # Start in background
-        asyncio.create_task(thinking_loop())
+        _start_task(thinking_loop())
     
     async def think_about(
         self,
@@ -229,7 +351,7 @@ class ContinuousThinkingEngine:
         
         # Create reasoning chain
         chain = ReasoningChain(
-            id=hashlib.md5(f"{topic}{datetime.now()}".encode()).hexdigest()[:8],
+            id=self._next_id(),
             root_thought=root_thought.id,
             thoughts=[root_thought.id]
         )
@@ -301,6 +423,10 @@ class ContinuousThinkingEngine:
                     remaining_depth - 1
                 )
     
+    def _next_id(self) -> str:
+        """Mint an 8 hex character ID unique within this engine"""
+        return f"{next(self._id_counter):08x}"
+    
     def _create_thought(
         self,
         type: ThoughtType,
@@ -312,7 +438,7 @@ class ContinuousThinkingEngine:
         """Create a new thought"""
         
         thought = Thought(
-            id=hashlib.md5(f"{content}{datetime.now()}".encode()).hexdigest()[:8],
+            id=self._next_id(),
             type=type,
             content=content,
             context=context,
@@ -331,6 +457,10 @@ class ContinuousThinkingEngine:
         # Store thought
         self.thoughts[thought.id] = thought
         self.active_thoughts.append(thought.id)
+        self._unindexed_thoughts.append(thought.id)
+        if thought.is_blocker():
+            self._pending_blockers.append(thought.id)
+        self._work_event.set()
         
         # Add to context
         if context in self.contexts:
@@ -342,7 +472,7 @@ class ContinuousThinkingEngine:
         """Create a new context"""
         
         context = Context(
-            id=hashlib.md5(f"{name}{datetime.now()}".encode()).hexdigest()[:8],
+            id=self._next_id(),
             name=name,
             description=f"Context for {name}",
             parent_context=parent
@@ -375,13 +505,7 @@ class ContinuousThinkingEngine:
     def _is_blocker(self, thought: Thought) -> bool:
         """Determine if a thought represents a blocker"""
         
-        blocker_keywords = [
-            'cannot', 'unable', 'blocked', 'failed', 'error',
-            'missing', 'required', 'depends', 'waiting', 'stuck'
-        ]
-        
-        content_lower = thought.content.lower()
-        return any(keyword in content_lower for keyword in blocker_keywords)
+        return _BLOCKER_RE.search(thought.content) is not None
     
     async def _find_alternative_path(
         self,
@@ -396,6 +520,7 @@ class ContinuousThinkingEngine:
         # Mark as blocker
         blocked_thought.type = ThoughtType.BLOCKER_DETECTION
         blocked_thought.action_required = True
+        self._pending_blockers.append(blocked_thought.id)
         
         # Generate alternatives
         alternatives = []
@@ -439,29 +564,29 @@ class ContinuousThinkingEngine:
         if not chain.thoughts:
             return "No conclusion reached"
         
-        # Gather all thoughts in chain
-        thoughts_content = []
-        for thought_id in chain.thoughts:
-            if thought_id in self.thoughts:
-                thought = self.thoughts[thought_id]
-                thoughts_content.append(f"{thought.type.value}: {thought.content}")
+        # Count thought types in the chain
+        counts = Counter(
+            self.thoughts[thought_id].type
+            for thought_id in chain.thoughts
+            if thought_id in self.thoughts
+        )
         
         # Create synthesis
         synthesis = f"Based on {len(chain.thoughts)} thoughts at depth {chain.depth}:\n"
         
         # Find key insights
-        problem_solving = [t for t in thoughts_content if 'problem_solving' in t]
-        alternatives = [t for t in thoughts_content if 'alternative' in t]
-        blockers = [t for t in thoughts_content if 'blocker' in t]
+        problem_solving = counts[ThoughtType.PROBLEM_SOLVING]
+        alternatives = counts[ThoughtType.ALTERNATIVE_PATH]
+        blockers = counts[ThoughtType.BLOCKER_DETECTION]
         
         if blockers:
-            synthesis += f"Identified {len(blockers)} blockers with alternatives.\n"
+            synthesis += f"Identified {blockers} blockers with alternatives.\n"
         
         if problem_solving:
-            synthesis += f"Found {len(problem_solving)} solution approaches.\n"
+            synthesis += f"Found {problem_solving} solution approaches.\n"
         
         if alternatives:
-            synthesis += f"Generated {len(alternatives)} alternative paths.\n"
+            synthesis += f"Generated {alternatives} alternative paths.\n"
         
         synthesis += f"Conclusion: Multi-path approach with {chain.confidence:.1%} confidence."
         
@@ -473,16 +598,17 @@ class ContinuousThinkingEngine:
         if not chain.thoughts:
             return 0.0
         
-        total_confidence = 0.0
-        for thought_id in chain.thoughts:
-            if thought_id in self.thoughts:
-                total_confidence += self.thoughts[thought_id].confidence
-        
-        # Average confidence, adjusted for depth
-        avg_confidence = total_confidence / len(chain.thoughts)
-        depth_bonus = min(chain.depth * 0.05, 0.3)  # Deeper thinking adds confidence
+        # Thoughts that are gone count as zero confidence
+        confidences = np.fromiter(
+            (
+                self.thoughts[thought_id].confidence if thought_id in self.thoughts else 0.0
+                for thought_id in chain.thoughts
+            ),
+            dtype=np.float64,
+            count=len(chain.thoughts),
+        )
         
-        return min(avg_confidence + depth_bonus, 1.0)
+        return float(_chain_confidence_kernel(confidences, chain.depth))
     
     async def lead_and_delegate(
         self,
@@ -517,7 +643,7 @@ class ContinuousThinkingEngine:
         delegation_plan = await self._delegate_work_items(work_items, resources)
         
         # Start monitoring
-        monitoring_task = asyncio.create_task(
+        monitoring_task = _start_task(
             self._monitor_delegated_work(work_items, context)
         )
         
@@ -555,7 +681,7 @@ class ContinuousThinkingEngine:
                 ThoughtType.DELEGATION
             ]:
                 work_item = WorkItem(
-                    id=hashlib.md5(f"work_{thought_id}".encode()).hexdigest()[:8],
+                    id=short_id(f"work_{thought_id}", 8),
                     description=thought.content,
                     context_id=context.id,
                     priority=thought.priority
@@ -567,7 +693,7 @@ class ContinuousThinkingEngine:
         # If no actionable items, create from conclusion
         if not work_items and chain.conclusion:
             work_item = WorkItem(
-                id=hashlib.md5(f"work_{chain.id}".encode()).hexdigest()[:8],
+                id=short_id(f"work_{chain.id}", 8),
                 description=chain.conclusion,
                 context_id=context.id,
                 priority=5
@@ -650,58 +776,84 @@ class ContinuousThinkingEngine:
                 pass
     
     async def _scan_for_blockers(self):
-        """Continuously scan for blockers across all contexts"""
+        """Block active contexts holding blockers detected since the last scan
         
-        for context_id, context in self.contexts.items():
+        Unresolved blockers wait with their context, blocking it again if it
+        is made active; they are dropped once the context is completed
+        """
+        
+        for context_id in list(self._waiting_blockers):
+            context = self.contexts.get(context_id)
+            if context is None or context.status == "completed":
+                del self._waiting_blockers[context_id]
+            elif context.status == "active":
+                self._pending_blockers.extend(self._waiting_blockers.pop(context_id))
+        
+        blocked_now = set()
+        while self._pending_blockers:
+            blocked = self.thoughts.get(self._pending_blockers.popleft())
+            if blocked is None or not blocked.is_blocker():
+                continue
+            
+            context = self.contexts.get(blocked.context)
+            if context is None or context.status == "completed":
+                continue
             if context.status == "active":
-                # Check for blocked thoughts
-                blocked_thoughts = [
-                    self.thoughts[tid] for tid in context.active_thoughts
-                    if tid in self.thoughts and self.thoughts[tid].is_blocker()
-                ]
-                
-                if blocked_thoughts:
-                    context.status = "blocked"
-                    
-                    # Find alternatives for each blocker
-                    for blocked in blocked_thoughts:
-                        if blocked.id not in self.alternative_paths:
-                            await self._find_alternative_path(blocked, context)
+                context.status = "blocked"
+                blocked_now.add(context.id)
+            
+            # Find alternatives for blockers of contexts blocked in this pass
+            if context.id in blocked_now and blocked.id not in self.alternative_paths:
+                await self._find_alternative_path(blocked, context)
+            
+            self._waiting_blockers.setdefault(context.id, {})[blocked.id] = None
     
     async def _discover_connections(self):
-        """Discover connections between thoughts"""
-        
-        # Sample recent thoughts
-        recent = list(self.active_thoughts)[-100:]
+        """Connect thoughts created since the last pass to similar recent ones"""
         
-        for i, thought_id1 in enumerate(recent):
-            if thought_id1 not in self.thoughts:
+        threshold = self.thinking_config['connection_threshold']
+        while self._unindexed_thoughts:
+            thought = self.thoughts.get(self._unindexed_thoughts.popleft())
+            if thought is None:
                 continue
-                
-            thought1 = self.thoughts[thought_id1]
             
-            for thought_id2 in recent[i+1:]:
-                if thought_id2 not in self.thoughts:
+            # Thoughts sharing an LSH bucket are candidates, confirmed exactly
+            signature = _minhash(thought.tokens)
+            keys = _lsh_bands(signature) if signature is not None else []
+            candidates = set()
+            for key in keys:
+                candidates.update(self._lsh_buckets.get(key, ()))
+            
+            for other_id in sorted(candidates):
+                other = self.thoughts.get(other_id)
+                if other is None or self._calculate_thought_similarity(thought, other) <= threshold:
                     continue
-                    
-                thought2 = self.thoughts[thought_id2]
                 
-                # Calculate similarity
-                similarity = self._calculate_thought_similarity(thought1, thought2)
-                
-                if similarity > self.thinking_config['connection_threshold']:
-                    # Create connection
-                    thought1.connections.append(thought_id2)
-                    thought2.connections.append(thought_id1)
-                    self.thought_connections[thought_id1].add(thought_id2)
-                    self.thought_connections[thought_id2].add(thought_id1)
+                # Create connection
+                thought.connections.append(other.id)
+                other.connections.append(thought.id)
+                self.thought_connections[thought.id].add(other.id)
+                self.thought_connections[other.id].add(thought.id)
+                self._csr_dirty = True
+            
+            # Index the thought, dropping the oldest once the window is full
+            for key in keys:
+                self._lsh_buckets[key].add(thought.id)
+            self._lsh_window.append((thought.id, keys))
+            if len(self._lsh_window) > CONNECTION_WINDOW:
+                old_id, old_keys = self._lsh_window.popleft()
+                for key in old_keys:
+                    bucket = self._lsh_buckets[key]
+                    bucket.discard(old_id)
+                    if not bucket:
+                        del self._lsh_buckets[key]
     
     def _calculate_thought_similarity(self, t1: Thought, t2: Thought) -> float:
         """Calculate similarity between two thoughts"""
         
         # Simple word overlap for now
-        words1 = set(t1.content.lower().split())
-        words2 = set(t2.content.lower().split())
+        words1 = t1.tokens
+        words2 = t2.tokens
         
         if not words1 or not words2:
             return 0.0
@@ -745,7 +897,7 @@ class ContinuousThinkingEngine:
                         self.current_context_stack.append(sibling_id)
                         
                         self.context_switches.append(
-                            (from_context.id, sibling_id, datetime.now())
+                            (from_context.id, sibling_id, time.time_ns())
                         )
                         
                         self.logger.info(f"🔄 Context switch: {from_context.name} → {sibling.name}")
@@ -788,9 +940,34 @@ class ContinuousThinkingEngine:
             f"Reminds me of {problem}"
         ]
     
+    def _connection_csr(self) -> Tuple[Dict[str, int], np.ndarray, np.ndarray]:
+        """Row of each thought plus CSR indptr/indices of the connection graph,
+        rebuilt only when connections changed since the last query"""
+        
+        if self._csr_dirty:
+            rows = {thought_id: i for i, thought_id in enumerate(self.thought_connections)}
+            indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum(
+                np.fromiter(
+                    (len(c) for c in self.thought_connections.values()),
+                    dtype=np.int64, count=len(rows)
+                ),
+                out=indptr[1:]
+            )
+            indices = np.fromiter(
+                (rows[other] for c in self.thought_connections.values() for other in c),
+                dtype=np.int64, count=int(indptr[-1])
+            )
+            self._csr = (rows, indptr, indices)
+            self._csr_dirty = False
+        
+        return self._csr
+    
     def get_thinking_status(self) -> Dict[str, Any]:
         """Get current thinking status"""
         
+        _, indptr, _ = self._connection_csr()
+        
         return {
             'total_thoughts': len(self.thoughts),
             'active_thoughts': len(self.active_thoughts),
@@ -799,7 +976,7 @@ class ContinuousThinkingEngine:
             'work_items': len(self.work_items),
             'blocked_paths': len(self.blocked_paths),
             'alternative_paths': len(self.alternative_paths),
-            'thought_connections': sum(len(c) for c in self.thought_connections.values()),
+            'thought_connections': int(indptr[-1]),
             'context_switches': len(self.context_switches),
             'current_context': self.current_context_stack[-1] if self.current_context_stack else None
         }
@@ -811,13 +988,15 @@ class ContinuousThinkingEngine:
         viz += "=" * 50 + "\n"
         
         recent = list(self.active_thoughts)[-limit:]
+        rows, indptr, _ = self._connection_csr()
         
         for thought_id in recent:
             if thought_id not in self.thoughts:
                 continue
                 
             thought = self.thoughts[thought_id]
-            connections = self.thought_connections.get(thought_id, set())
+            row = rows.get(thought_id)
+            connections = 0 if row is None else int(indptr[row + 1] - indptr[row])
             
             viz += f"\n[{thought.type.value[:4]}] {thought.content[:40]}..."
             
@@ -828,7 +1007,7 @@ class ContinuousThinkingEngine:
                 viz += f"\n  ↓ Children: {len(thought.child_thoughts)}"
             
             if connections:
-                viz += f"\n  ↔ Connected: {len(connections)}"
+                viz += f"\n  ↔ Connected: {connections}"
             
             if thought.is_blocker():
                 viz += "\n  🚧 BLOCKER"
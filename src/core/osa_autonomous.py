@@ -27,7 +27,9 @@ from .task_planner import get_task_planner, TaskType, TaskPriority
 from .mcp_client import get_mcp_client
 from .code_generator import get_code_generator, CodeGenerationRequest, CodeType, ProgrammingLanguage
 from .agent_orchestrator import get_agent_orchestrator, AgentType, CollaborationMode
-from .memory_adapter import get_persistent_memory, MemoryType, MemoryPriority
+# persistent_ai_memory is loaded on first attribute access, not at import
+from . import memory_adapter
+from .memory_adapter import auto_load_vision
 
 
 class IntentType(Enum):
@@ -112,7 +114,8 @@ class OSAAutonomous:
         # Initialize persistent memory system
         self.persistent_memory = None
         try:
-            self.persistent_memory = get_persistent_memory(config)
+            auto_load_vision()
+            self.persistent_memory = memory_adapter.get_persistent_memory(config)
             self.logger.info("Persistent memory system initialized")
             
             # Load critical context from previous sessions
@@ -437,8 +440,8 @@ class OSAAutonomous:
         if self.persistent_memory:
             self.persistent_memory.store_memory(
                 content=f"User Query: {user_input}\nIntent: {intent.value}",
-                memory_type=MemoryType.CONTEXT,
-                priority=MemoryPriority.MEDIUM,
+                memory_type=memory_adapter.MemoryType.CONTEXT,
+                priority=memory_adapter.MemoryPriority.MEDIUM,
                 metadata={"intent": intent.value, "confidence": confidence}
             )
         
@@ -824,8 +827,8 @@ Lesson: Successfully handled {intent.value} request"""
             
             self.persistent_memory.store_memory(
                 content=learning_content,
-                memory_type=MemoryType.LEARNING,
-                priority=MemoryPriority.MEDIUM,
+                memory_type=memory_adapter.MemoryType.LEARNING,
+                priority=memory_adapter.MemoryPriority.MEDIUM,
                 metadata={
                     "intent": intent.value,
                     "success": True
@@ -310,6 +310,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "performance: mark test as performance test"
     )
+    config.addinivalue_line(
+        "markers", "regression: mark test as regression test"
+    )
 
 
 # Test collection customization
@@ -334,7 +337,9 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(pytest.mark.security)
 
 
-# Timeout configuration for different test types
+# Timeout configuration for different test types, only used when
+# pytest-timeout is installed
+@pytest.hookimpl(optionalhook=True)
 def pytest_timeout_set_timer(item, timeout):
     """Set different timeouts for different test types."""
     if item.get_closest_marker("slow"):
@@ -0,0 +1,197 @@
+"""
+Unit tests for the daily architecture reviewer.
+"""
+
+import asyncio
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from core.modules import architecture_reviewer
+from core.modules.architecture_reviewer import (
+    ArchitectureComponent, DailyArchitectureReviewer, ToolEvaluation
+)
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Empty home directory for the reviewer's on-disk cache."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+def evaluation(name, score):
+    return ToolEvaluation(name=name, version="1.0", category="backend",
+                          pros=["fast"], cons=[], score=score)
+
+
+class TestAlternativeFilter:
+    """Test the replacement threshold and the pre-filter on alternatives."""
+
+    @pytest.fixture(autouse=True)
+    def known_tools(self, monkeypatch):
+        """A young, little-starred alternative that outscores the current tool."""
+        monkeypatch.setattr(architecture_reviewer, "_KNOWN_TOOLS", {
+            **architecture_reviewer._KNOWN_TOOLS,
+            "TinyTool": {
+                "github_stars": 200,
+                "last_commit_age": timedelta(days=400),
+                "documentation_quality": "good",
+                "learning_curve": "easy",
+                "integrations": 3
+            }
+        })
+
+    def make_reviewer(self, monkeypatch, **kwargs):
+        reviewer = DailyArchitectureReviewer(**kwargs)
+        scores = {"FastAPI": 0.5, "TinyTool": 0.9}
+        evaluated = []
+
+        async def fake_evaluate(tool_name, category):
+            evaluated.append(tool_name)
+            return evaluation(tool_name, scores[tool_name])
+
+        monkeypatch.setattr(reviewer, "_evaluate_tool", fake_evaluate)
+        return reviewer, evaluated
+
+    def component(self):
+        return ArchitectureComponent(
+            name="web_backend", category="backend", current_version="1.0",
+            current_tool="FastAPI", purpose="API", last_reviewed_ts=time.time(),
+            performance_score=0.5, alternatives=[{"name": "TinyTool"}]
+        )
+
+    @pytest.mark.asyncio
+    async def test_default_filter_skips_unpopular_alternatives(self, home, monkeypatch):
+        """Alternatives under the default star and age bars are not evaluated."""
+        reviewer, evaluated = self.make_reviewer(monkeypatch)
+
+        assert await reviewer._review_component(self.component()) is None
+        assert evaluated == ["FastAPI"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_filter_considers_every_alternative(self, home, monkeypatch):
+        """With the filter off, a low-star, high-score alternative is recommended."""
+        reviewer, evaluated = self.make_reviewer(
+            monkeypatch, min_alternative_stars=0, max_alternative_age=None
+        )
+
+        improvement = await reviewer._review_component(self.component())
+
+        assert evaluated == ["FastAPI", "TinyTool"]
+        assert improvement.replacement == "TinyTool"
+
+    @pytest.mark.asyncio
+    async def test_margin_is_configurable(self, home, monkeypatch):
+        """Under a higher margin the current tool can no longer be beaten."""
+        reviewer, evaluated = self.make_reviewer(
+            monkeypatch, better_tool_margin=2.0,
+            min_alternative_stars=0, max_alternative_age=None
+        )
+
+        assert await reviewer._review_component(self.component()) is None
+        assert evaluated == ["FastAPI"]
+
+
+class TestLogging:
+    """Test where the reviewer's log records go."""
+
+    def test_records_propagate(self, home, caplog):
+        """Records reach handlers configured above the reviewer's logger."""
+        reviewer = DailyArchitectureReviewer()
+
+        with caplog.at_level("INFO"):
+            reviewer.logger.info("review started")
+
+        assert "review started" in caplog.messages
+        assert reviewer.logger.propagate
+
+
+class TestResearchCache:
+    """Test the per-need research result cache."""
+
+    @pytest.mark.asyncio
+    async def test_results_are_independent_copies(self, home):
+        """Editing a returned result leaves later results for the need intact."""
+        reviewer = DailyArchitectureReviewer()
+
+        first = await reviewer.research_specific_need("user authentication")
+        expected = [dict(tool, pros=list(tool["pros"])) for tool in first["recommended_tools"]]
+        first["recommended_tools"][0]["pros"].append("edited")
+        first["recommended_tools"].clear()
+        first["reasoning"].append("edited")
+        second = await reviewer.research_specific_need("User Authentication ")
+
+        assert second["recommended_tools"] == expected
+        assert "edited" not in second["reasoning"]
+        assert second["need"] == "User Authentication "
+
+
+class Lookup:
+    """Counts how often its cached coroutine method really runs."""
+
+    def __init__(self):
+        self.calls = 0
+        self.delay = 0.0
+
+    @architecture_reviewer._async_lfu_cache(maxsize=2, ttl=60.0)
+    async def value(self, key):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return [key, self.calls]
+
+
+class TestAsyncLFUCache:
+    """Test the coroutine memoizer behind the research cache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_run(self):
+        """Callers waiting on the same key share a single call."""
+        lookup = Lookup()
+        lookup.delay = 0.01
+
+        results = await asyncio.gather(*(lookup.value("a") for _ in range(3)))
+
+        assert results == [["a", 1]] * 3
+        assert lookup.calls == 1
+
+    def test_results_outlive_their_event_loop(self):
+        """A result cached under one event loop is served under the next."""
+        lookup = Lookup()
+
+        assert asyncio.run(lookup.value("a")) == ["a", 1]
+        assert asyncio.run(lookup.value("a")) == ["a", 1]
+        assert lookup.calls == 1
+
+    def test_call_cancelled_with_its_loop_is_retried(self):
+        """A call cut off when its loop shut down is not cached."""
+        lookup = Lookup()
+        lookup.delay = 1.0
+
+        async def give_up():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(lookup.value("a"), 0.01)
+
+        asyncio.run(give_up())
+        lookup.delay = 0.0
+
+        assert asyncio.run(lookup.value("a")) == ["a", 2]
+
+    @pytest.mark.asyncio
+    async def test_old_favourites_decay(self):
+        """A key popular long ago is eventually evicted by a stream of new keys."""
+        lookup = Lookup()
+        for _ in range(10):
+            await lookup.value("popular")
+
+        for key in range(10):
+            await lookup.value(key)
+
+        calls = lookup.calls
+        await lookup.value("popular")
+        assert lookup.calls == calls + 1
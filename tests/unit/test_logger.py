@@ -0,0 +1,47 @@
+"""
+Unit tests for the OSA real-time logger.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from core.logger import OSALogger
+
+
+@pytest.fixture
+def osa_logger(tmp_path, monkeypatch):
+    """OSALogger writing its session logs under an empty home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    logger = OSALogger()
+    yield logger
+    logger.close()
+
+
+class TestFileLogging:
+    """Test the queued file logging behind OSALogger."""
+
+    def test_close_writes_queued_records(self, osa_logger):
+        """Records still queued when the logger closes reach the log file."""
+        for i in range(100):
+            osa_logger.logger.info("record %d", i)
+
+        osa_logger.close()
+
+        text = (osa_logger.session_dir / "osa.log").read_text()
+        assert "record 99" in text
+        assert osa_logger.log_listener is None
+
+    def test_replaced_listener_is_stopped(self, osa_logger):
+        """Setting up file logging again drains and stops the previous listener."""
+        previous = osa_logger.log_listener
+        osa_logger.logger.info("before the swap")
+
+        osa_logger.setup_file_logging()
+
+        assert previous._thread is None
+        assert osa_logger.log_listener is not previous
+        assert "before the swap" in Path(previous.handlers[0].baseFilename).read_text()
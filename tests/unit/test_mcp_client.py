@@ -0,0 +1,265 @@
+"""
+Unit tests for the MCP client.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from core.mcp_client import MCPClient, MCPServerConfig, MCPServerType, _read_message
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """MCP client with an empty home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return MCPClient()
+
+
+class TestDefaultConfigs:
+    """Test the per-instance default server configurations."""
+
+    def test_instances_do_not_share_configs(self, client):
+        """Mutating one client's configs leaves other clients untouched."""
+        other = MCPClient()
+
+        client.default_configs["git"].args.append("--verbose")
+        client.default_configs["github"].env["GITHUB_TOKEN"] = "changed"
+        client.default_configs["filesystem"].config["allowed_directories"].append("/tmp")
+
+        assert other.default_configs["git"].args == ["-y", "@modelcontextprotocol/server-git"]
+        assert other.default_configs["github"].env["GITHUB_TOKEN"] != "changed"
+        assert "/tmp" not in other.default_configs["filesystem"].config["allowed_directories"]
+
+
+class FakeServer:
+    """Stands in for send_command, answering each call with a fresh result."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, server_name, command):
+        self.calls.append(command["params"])
+        return {"content": f"result {len(self.calls)}", "lines": ["a", "b"]}
+
+
+class TestToolCache:
+    """Test the read-only tool result cache."""
+
+    def make_client(self, tmp_path, monkeypatch, **config):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        client = MCPClient({"tool_cache_ttl": 60.0, **config})
+        server = FakeServer()
+        monkeypatch.setattr(client, "send_command", server)
+        return client, server
+
+    @pytest.mark.asyncio
+    async def test_repeated_read_is_served_from_cache(self, tmp_path, monkeypatch):
+        """A second identical read does not reach the server."""
+        client, server = self.make_client(tmp_path, monkeypatch)
+
+        first = await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+        second = await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+
+        assert first == second
+        assert len(server.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_copies(self, tmp_path, monkeypatch):
+        """Mutating a returned result does not change later cache hits."""
+        client, server = self.make_client(tmp_path, monkeypatch)
+
+        first = await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+        first["lines"].append("c")
+        first["content"] = "changed"
+        second = await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+        second["lines"].clear()
+        third = await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+
+        assert third == {"content": "result 1", "lines": ["a", "b"]}
+        assert len(server.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        """The least recently used result is evicted past tool_cache_size."""
+        client, server = self.make_client(tmp_path, monkeypatch, tool_cache_size=2)
+
+        await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+        await client.call_tool("filesystem", "read_file", {"path": "b.txt"})
+        await client.call_tool("filesystem", "read_file", {"path": "a.txt"})  # a is now recent
+        await client.call_tool("filesystem", "read_file", {"path": "c.txt"})
+
+        assert len(client._tool_cache) == 2
+        await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+        assert len(server.calls) == 3
+        await client.call_tool("filesystem", "read_file", {"path": "b.txt"})
+        assert len(server.calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_dropped_on_read(self, tmp_path, monkeypatch):
+        """An expired result is removed when read and fetched again."""
+        client, server = self.make_client(tmp_path, monkeypatch)
+
+        await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+        await client.call_tool("filesystem", "read_file", {"path": "b.txt"})
+        client._tool_cache_ttl = 0.0
+
+        await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+        assert len(server.calls) == 3
+        assert [key[2] for key in client._tool_cache] == [(("path", "b.txt"),), (("path", "a.txt"),)]
+
+        client._tool_cache_ttl = 60.0
+        await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+        assert len(server.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_server_cache(self, tmp_path, monkeypatch):
+        """A non-cacheable call drops cached reads for that server only."""
+        client, server = self.make_client(tmp_path, monkeypatch)
+
+        await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+        await client.call_tool("git", "status", {"path": "."})
+        await client.call_tool("filesystem", "write_file", {"path": "a.txt", "content": "x"})
+        await client.call_tool("filesystem", "read_file", {"path": "a.txt"})
+        await client.call_tool("git", "status", {"path": "."})
+
+        assert len(server.calls) == 4
+
+
+# Minimal newline-delimited JSON-RPC server: acknowledges initialize and
+# answers every other request with its method and params
+ECHO_SERVER = """
+import json, sys
+for line in sys.stdin:
+    message = json.loads(line)
+    if "id" not in message:
+        continue
+    if message["method"] == "initialize":
+        result = {"protocolVersion": "2024-11-05", "capabilities": {}}
+    else:
+        result = {"method": message["method"], "params": message.get("params")}
+    sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}) + "\\n")
+    sys.stdout.flush()
+"""
+
+# Announces a larger Content-Length body than it sends, then exits
+TRUNCATED_SERVER = """
+import sys
+sys.stdin.readline()
+sys.stdout.write("Content-Length: 100\\r\\n\\r\\n" + '{"jsonrpc": "2.0"')
+sys.stdout.flush()
+"""
+
+
+# Acknowledges initialize, then exits once the client says it is ready
+EXITING_SERVER = """
+import json, sys
+message = json.loads(sys.stdin.readline())
+result = {"protocolVersion": "2024-11-05", "capabilities": {}}
+sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}) + "\\n")
+sys.stdout.flush()
+sys.stdin.readline()
+"""
+
+
+def add_python_server(client, name, script):
+    """Register a custom server running a Python script."""
+    client.default_configs[name] = MCPServerConfig(
+        name=name,
+        server_type=MCPServerType.CUSTOM,
+        command=sys.executable,
+        args=["-c", script]
+    )
+
+
+class TestMessageFraming:
+    """Test reading newline-delimited and Content-Length framed messages."""
+
+    def make_reader(self, data):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return reader
+
+    @pytest.mark.asyncio
+    async def test_newline_delimited(self):
+        """Plain JSON lines are returned as-is."""
+        reader = self.make_reader(b'{"id": 1}\n{"id": 2}\n')
+
+        assert await _read_message(reader) == b'{"id": 1}\n'
+        assert await _read_message(reader) == b'{"id": 2}\n'
+        assert await _read_message(reader) == b""
+
+    @pytest.mark.asyncio
+    async def test_content_length_framed(self):
+        """A framed body is read exactly, newlines included."""
+        body = b'{"id": 1,\n "result": "two\\nlines"}'
+        reader = self.make_reader(
+            b"Content-Length: %d\r\nContent-Type: application/json\r\n\r\n" % len(body)
+            + body + b'{"id": 2}\n'
+        )
+
+        assert await _read_message(reader) == body
+        assert await _read_message(reader) == b'{"id": 2}\n'
+
+    @pytest.mark.asyncio
+    async def test_truncated_body_raises_eof(self):
+        """A body shorter than announced raises IncompleteReadError."""
+        reader = self.make_reader(b"Content-Length: 100\r\n\r\n{}")
+
+        with pytest.raises(asyncio.IncompleteReadError):
+            await _read_message(reader)
+
+
+class TestServerLifecycle:
+    """Test the initialize handshake and request routing with real processes."""
+
+    @pytest.mark.asyncio
+    async def test_handshake_and_call(self, client):
+        """A server that answers initialize can be called and stopped."""
+        add_python_server(client, "echo", ECHO_SERVER)
+
+        assert await client.start_server("echo")
+        responses = await asyncio.gather(*(
+            client.call_tool("echo", "write_file", {"path": f"{i}.txt"})
+            for i in range(5)
+        ))
+        assert [r["result"]["params"]["arguments"]["path"] for r in responses] == [
+            f"{i}.txt" for i in range(5)
+        ]
+
+        assert await client.stop_server("echo")
+        assert "echo" not in client._runtime
+
+    @pytest.mark.asyncio
+    async def test_truncated_handshake_is_cleaned_up(self, client):
+        """A truncated initialize reply fails the start without leaving state behind."""
+        add_python_server(client, "truncated", TRUNCATED_SERVER)
+
+        assert not await client.start_server("truncated")
+        assert "truncated" not in client._runtime
+
+        # Not reported as already running, so a retry spawns it again
+        assert not await client.start_server("truncated")
+        assert "truncated" not in client._runtime
+
+    @pytest.mark.asyncio
+    async def test_exited_server_fails_fast(self, client):
+        """Once a server exits, requests to it fail without waiting for the timeout."""
+        add_python_server(client, "exiting", EXITING_SERVER)
+        client.request_timeout = 30
+
+        assert await client.start_server("exiting")
+        runtime = client._runtime["exiting"]
+        await asyncio.wait_for(runtime.reader_task, 5)
+
+        assert not client._is_connected("exiting")
+        assert runtime.writer_task.cancelled()
+        assert not client.get_all_server_status()["servers"]["exiting"]["running"]
+        assert await asyncio.wait_for(client.send_command("exiting", {"method": "ping"}), 1) is None
+
+        assert await client.stop_server("exiting")
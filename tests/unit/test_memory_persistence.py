@@ -0,0 +1,244 @@
+"""
+Unit tests for OSA memory persistence.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+pytest.importorskip("sentence_transformers")
+
+from core import memory_persistence
+from core.memory_persistence import MemoryPriority, MemoryType, PersistentMemory
+
+DIM = 32
+
+
+def unit(*components):
+    """Unit vector with the given leading components."""
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[:len(components)] = components
+    return vector / np.linalg.norm(vector)
+
+
+def angle(degrees):
+    """Unit vector at an angle in the plane of the first two axes."""
+    radians = np.radians(degrees)
+    return unit(np.cos(radians), np.sin(radians))
+
+
+class FakeEmbedder:
+    """Deterministic encoder: known texts get fixed vectors, others a
+    pseudo-random one far from the first two axes."""
+
+    def __init__(self, vectors=None):
+        self.vectors = vectors or {}
+        self.encoded = []
+
+    def _vector(self, text):
+        if text in self.vectors:
+            return self.vectors[text]
+        rng = np.random.default_rng(zlib.crc32(text.encode()))
+        vector = rng.standard_normal(DIM).astype(np.float32)
+        vector[:2] = 0.0
+        return vector / np.linalg.norm(vector)
+
+    def encode(self, sentences, batch_size=32, show_progress_bar=False,
+               convert_to_numpy=True, normalize_embeddings=False):
+        single = isinstance(sentences, str)
+        sentences = [sentences] if single else list(sentences)
+        self.encoded.extend(sentences)
+        embeddings = np.stack([self._vector(text) for text in sentences])
+        return embeddings[0] if single else embeddings
+
+
+class SlowEmbedder(FakeEmbedder):
+    """FakeEmbedder that takes a while and counts overlapping calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.active = 0
+        self.max_active = 0
+
+    def encode(self, sentences, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        time.sleep(0.005)
+        try:
+            return super().encode(sentences, **kwargs)
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def embedder():
+    return FakeEmbedder()
+
+
+@pytest.fixture(params=["chroma", "hnswlib"])
+def memory(request, tmp_path, monkeypatch, embedder):
+    """PersistentMemory in an empty home directory with a fake encoder."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(memory_persistence, "_get_embedder", lambda *args: embedder)
+    memory = PersistentMemory({"vector_store": request.param})
+    yield memory
+    memory.close()
+
+
+def contents(memory):
+    return sorted(row[0] for row in memory.conn.execute("SELECT content FROM memories"))
+
+
+class TestCompressMemories:
+    """Test grouping and merging of similar memories."""
+
+    def test_merges_similar_memories(self, memory, embedder):
+        """Memories above the threshold are merged into the first one."""
+        embedder.vectors.update({"a": angle(0), "a2": angle(10), "far": angle(90)})
+        memory.bulk_store(["a", "a2", "far"], [MemoryType.LEARNING] * 3)
+        memory.max_memories = 1
+
+        memory.compress_memories()
+
+        assert "[Merged] a\n---\na2" in contents(memory)
+        assert "far" in contents(memory)
+        assert "a2" not in contents(memory)
+
+    def test_chains_are_not_merged_transitively(self, memory, embedder):
+        """With a~b and b~c but not a~c, only a and b are merged."""
+        embedder.vectors.update({"a": angle(0), "b": angle(25), "c": angle(50)})
+        memory.bulk_store(["a", "b", "c"], [MemoryType.LEARNING] * 3)
+        memory.max_memories = 1
+
+        memory.compress_memories()
+
+        assert "[Merged] a\n---\nb" in contents(memory)
+        assert "c" in contents(memory)
+
+    def test_small_stores_are_left_alone(self, memory, embedder):
+        """Nothing is merged while the store is within max_memories."""
+        embedder.vectors.update({"a": angle(0), "a2": angle(5)})
+        memory.bulk_store(["a", "a2"], [MemoryType.LEARNING] * 2)
+
+        memory.compress_memories()
+
+        assert {"a", "a2"} <= set(contents(memory))
+
+
+class TestMergeGroups:
+    """Test the pair grouping used by compress_memories."""
+
+    def test_each_member_pairs_with_its_root(self):
+        """Members join the earliest kept memory they are paired with."""
+        pairs = [(0, 1), (0, 3), (1, 2), (2, 4), (3, 4)]
+
+        assert memory_persistence._merge_groups(pairs) == {0: [0, 1, 3], 2: [2, 4]}
+
+
+class TestEmbeddingCache:
+    """Test reuse of cached embeddings."""
+
+    def test_repeated_content_is_encoded_once(self, memory, embedder):
+        """Exact repeats are served from the cache."""
+        memory._encode(["find the config file"])
+        memory._encode(["find the config file"])
+
+        assert embedder.encoded.count("find the config file") == 1
+
+    def test_near_duplicates_are_encoded_separately(self, memory, embedder):
+        """Texts differing by a single word get their own embeddings."""
+        context = "When cleaning up after a failed release build on the shared runner, "
+        first = context + "do not delete the generated lock file"
+        second = context + "do delete the generated lock file"
+        embedder.vectors.update({first: angle(0), second: angle(180)})
+
+        memory._encode([first])
+        embedding = memory._encode([second])[0]
+
+        assert embedder.encoded[-2:] == [first, second]
+        assert np.allclose(embedding, angle(180), atol=1e-3)
+
+
+class TestClose:
+    """Test saving and releasing resources."""
+
+    def test_vectors_survive_without_close(self, memory, embedder):
+        """Stored vectors are on disk before the instance is closed."""
+        embedder.vectors["a"] = angle(0)
+        memory_id = memory.store_memory("a", MemoryType.LEARNING)
+
+        reopened = PersistentMemory(memory.config)
+        try:
+            assert reopened.collection.get(ids=[memory_id])["ids"] == [memory_id]
+        finally:
+            reopened.close()
+
+    def test_close_saves_cache_and_is_idempotent(self, memory):
+        """close() writes the embedding cache once and can be repeated."""
+        memory.close()
+        memory.close()
+
+        assert memory.embedding_cache_file.exists()
+        assert memory not in memory_persistence._open_memories
+
+
+class TestThreadSafety:
+    """Test sharing one instance between threads and async callers."""
+
+    @pytest.fixture
+    def embedder(self):
+        return SlowEmbedder()
+
+    @pytest.mark.asyncio
+    async def test_threads_and_async_callers_are_serialized(self, memory, embedder):
+        """Concurrent stores and recalls never overlap and lose no writes."""
+        def store(worker):
+            for i in range(10):
+                memory.store_memory(f"worker {worker} memory {i}", MemoryType.LEARNING)
+
+        threads = [threading.Thread(target=store, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for i in range(10):
+            await memory.store_memory_async(f"async memory {i}", MemoryType.LEARNING)
+            await memory.recall_memories_async("memory")
+        for thread in threads:
+            thread.join()
+
+        assert embedder.max_active == 1
+        stored = set(contents(memory))
+        assert {f"worker {w} memory {i}" for w in range(4) for i in range(10)} <= stored
+        assert {f"async memory {i}" for i in range(10)} <= stored
+
+    @pytest.mark.asyncio
+    async def test_cached_context_does_not_wait_for_writes(self, memory):
+        """A fresh context snapshot is served while a write holds the instance lock."""
+        expected = memory.get_context_for_session()
+        writing, finish = threading.Event(), threading.Event()
+
+        def write():
+            with memory._lock:
+                writing.set()
+                finish.wait(5)
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        writing.wait(5)
+        started = time.monotonic()
+        try:
+            context = await asyncio.wait_for(memory.get_context_for_session_async(), 5)
+        finally:
+            elapsed = time.monotonic() - started
+            finish.set()
+            thread.join()
+
+        assert context == expected
+        assert elapsed < 1.0
@@ -0,0 +1,93 @@
+"""
+Unit tests for OSA's continuous thinking engine module.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from core.modules.thinking import ContinuousThinkingEngine, ThoughtType
+
+
+async def make_engine():
+    """Engine whose passes are driven by the test, not the background loop."""
+    engine = ContinuousThinkingEngine()
+    engine.thinking_enabled = False
+    engine._work_event.set()
+    await asyncio.sleep(0)
+    return engine
+
+
+def add_blocker(engine, context):
+    return engine._create_thought(
+        type=ThoughtType.BLOCKER_DETECTION,
+        content="Deployment failed: missing config",
+        context=context.id,
+        depth=1
+    )
+
+
+class TestBlockerScan:
+    """Test detection of blockers between thinking passes."""
+
+    @pytest.mark.asyncio
+    async def test_active_context_is_blocked(self):
+        """A new blocker blocks its context and gets alternatives."""
+        engine = await make_engine()
+        context = engine._create_context("deploy")
+        blocker = add_blocker(engine, context)
+
+        await engine._scan_for_blockers()
+
+        assert context.status == "blocked"
+        assert blocker.id in engine.alternative_paths
+
+    @pytest.mark.asyncio
+    async def test_blocker_waits_for_its_context_to_be_active(self):
+        """A blocker found while its context is blocked is handled on reactivation."""
+        engine = await make_engine()
+        context = engine._create_context("deploy")
+        context.status = "blocked"
+        blocker = add_blocker(engine, context)
+
+        await engine._scan_for_blockers()
+        assert blocker.id not in engine.alternative_paths
+
+        context.status = "active"
+        await engine._scan_for_blockers()
+
+        assert context.status == "blocked"
+        assert blocker.id in engine.alternative_paths
+
+    @pytest.mark.asyncio
+    async def test_resolved_blocker_does_not_block_again(self):
+        """A reactivated context stays active once its blockers are resolved."""
+        engine = await make_engine()
+        context = engine._create_context("deploy")
+        blocker = add_blocker(engine, context)
+        await engine._scan_for_blockers()
+
+        blocker.resolved = True
+        context.status = "active"
+        await engine._scan_for_blockers()
+
+        assert context.status == "active"
+
+    @pytest.mark.asyncio
+    async def test_blockers_of_completed_contexts_are_dropped(self):
+        """Nothing is kept for a context that has completed."""
+        engine = await make_engine()
+        context = engine._create_context("deploy")
+        context.status = "blocked"
+        add_blocker(engine, context)
+        await engine._scan_for_blockers()
+
+        context.status = "completed"
+        await engine._scan_for_blockers()
+
+        assert not engine._pending_blockers
+        assert not engine._waiting_blockers